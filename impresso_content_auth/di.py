@@ -1,67 +1,278 @@
-from typing import Literal
+from __future__ import annotations
+
+from functools import cache, partial
+from typing import TYPE_CHECKING, Literal, Optional
+
 from dependency_injector import containers, providers
-import redis.asyncio as redis
-
-from impresso_content_auth.service.solr import SolrService
-from impresso_content_auth.service.quota_checker.base import QuotaChecker
-from impresso_content_auth.service.quota_checker.redis_quota_checker import RedisQuotaChecker
-from impresso_content_auth.service.quota_checker.null_quota_checker import NullQuotaChecker
-from impresso_content_auth.strategy.extractor.base import NullExtractorStrategy
-from impresso_content_auth.strategy.extractor.bearer_token import BearerTokenExtractor
-from impresso_content_auth.strategy.extractor.cookie_bitmap_extractor import (
-    CookieBitmapExtractor,
-)
-from impresso_content_auth.strategy.extractor.cookie_user_id_extractor import (
-    CookieUserIdExtractor,
-)
-from impresso_content_auth.strategy.extractor.iiif_presentation_manifest import (
-    IIIFPresentationManifestExtractor,
-    extract_url_from_x_original_uri,
-)
-from impresso_content_auth.strategy.extractor.iiif_uri_doc_id_extractor import (
-    IIIFUriDocIdExtractor,
-)
-from impresso_content_auth.strategy.extractor.manifest_with_secret import (
-    ManifestWithSecretExtractor,
-)
-from impresso_content_auth.strategy.extractor.solr_document import (
-    SolrDocumentExtractor,
-    extract_id_from_x_original_uri_with_iiif, extract_id_from_x_original_uri_with_iiif_and_wildcard_page_suffix,
-)
-from impresso_content_auth.strategy.extractor.static_secret import StaticSecretExtractor
-from impresso_content_auth.strategy.matcher.base import NullMatcherStrategy
-from impresso_content_auth.strategy.matcher.bitwise_and import BitWiseAndMatcherStrategy
-from impresso_content_auth.strategy.matcher.equality import EqualityMatcher
-from impresso_content_auth.strategy.matcher.quota_matcher import QuotaMatcher
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+    from impresso_content_auth.service.quota_checker.null_quota_checker import (
+        NullQuotaChecker,
+    )
+    from impresso_content_auth.service.quota_checker.redis_quota_checker import (
+        RedisQuotaChecker,
+    )
+    from impresso_content_auth.service.solr import SolrService
+    from impresso_content_auth.strategy.extractor.bearer_token import (
+        BearerTokenExtractor,
+    )
+    from impresso_content_auth.strategy.extractor.cookie_bitmap_extractor import (
+        CookieBitmapExtractor,
+    )
+    from impresso_content_auth.strategy.extractor.cookie_user_id_extractor import (
+        CookieUserIdExtractor,
+    )
+    from impresso_content_auth.strategy.extractor.iiif_presentation_manifest import (
+        IIIFPresentationManifestExtractor,
+    )
+    from impresso_content_auth.strategy.extractor.iiif_uri_doc_id_extractor import (
+        IIIFUriDocIdExtractor,
+    )
+    from impresso_content_auth.strategy.extractor.manifest_with_secret import (
+        ManifestWithSecretExtractor,
+    )
+    from impresso_content_auth.strategy.extractor.solr_document import (
+        SolrDocumentExtractor,
+    )
+    from impresso_content_auth.strategy.extractor.static_secret import (
+        StaticSecretExtractor,
+    )
+    from impresso_content_auth.strategy.matcher.bitwise_and import (
+        BitWiseAndMatcherStrategy,
+    )
+    from impresso_content_auth.strategy.matcher.equality import EqualityMatcher
+    from impresso_content_auth.strategy.matcher.quota_matcher import QuotaMatcher
+
+
+# The factory functions below defer importing the heavy implementation modules
+# (redis, httpx, jwt, dacite) until the corresponding provider is actually
+# resolved. A deployment that disables a strategy via configuration never pays
+# for its imports.
+
+
+def _make_redis_connection_pool(url: str) -> redis.ConnectionPool:
+    import redis.asyncio as redis
+
+    # decode_responses stays off: the quota script only returns integers,
+    # so decoding every reply to str would be wasted work.
+    return redis.ConnectionPool.from_url(url)
+
+
+def _make_redis_client(connection_pool: redis.ConnectionPool) -> redis.Redis:
+    import redis.asyncio as redis
+
+    return redis.Redis(connection_pool=connection_pool)
+
+
+def _make_null_quota_checker() -> NullQuotaChecker:
+    from impresso_content_auth.service.quota_checker.null_quota_checker import (
+        NullQuotaChecker,
+    )
+
+    return NullQuotaChecker()
+
+
+def _make_redis_quota_checker(
+    redis_client: redis.Redis, quota_limit: int, window_seconds: int
+) -> RedisQuotaChecker:
+    from impresso_content_auth.service.quota_checker.redis_quota_checker import (
+        RedisQuotaChecker,
+    )
+
+    return RedisQuotaChecker(
+        redis_client=redis_client,
+        quota_limit=quota_limit,
+        window_seconds=window_seconds,
+    )
+
+
+def _make_solr_service(
+    base_url: str,
+    username: Optional[str],
+    password: Optional[str],
+    proxy_url: Optional[str],
+) -> SolrService:
+    from impresso_content_auth.service.solr import SolrService
+
+    return SolrService(
+        base_url=base_url,
+        username=username,
+        password=password,
+        proxy_url=proxy_url,
+    )
+
+
+def _make_bearer_token_extractor() -> BearerTokenExtractor:
+    from impresso_content_auth.strategy.extractor.bearer_token import (
+        BearerTokenExtractor,
+    )
+
+    return BearerTokenExtractor()
+
+
+def _make_manifest_with_secret_extractor(base_path: str) -> ManifestWithSecretExtractor:
+    from impresso_content_auth.strategy.extractor.manifest_with_secret import (
+        ManifestWithSecretExtractor,
+    )
+
+    return ManifestWithSecretExtractor(base_path=base_path)
+
+
+def _make_static_secret_extractor(secret: str) -> StaticSecretExtractor:
+    from impresso_content_auth.strategy.extractor.static_secret import (
+        StaticSecretExtractor,
+    )
+
+    return StaticSecretExtractor(secret=secret)
+
+
+def _make_solr_content_item_extractor(
+    solr_service: SolrService, collection: str, field: str
+) -> SolrDocumentExtractor:
+    from impresso_content_auth.strategy.extractor.solr_document import (
+        SolrDocumentExtractor,
+        extract_id_from_x_original_uri_with_iiif_and_wildcard_page_suffix,
+    )
+
+    return SolrDocumentExtractor(
+        solr_service=solr_service,
+        collection=collection,
+        field=field,
+        # - To match by page ID:
+        # id_extractor_func=extract_id_from_x_original_uri_with_iiif,
+        # solr_id_field="page_id_ss",
+        # - To match by content item ID prefix:
+        solr_id_field="id",
+        id_extractor_func=extract_id_from_x_original_uri_with_iiif_and_wildcard_page_suffix,
+    )
+
+
+def _make_cookie_bitmap_extractor(
+    cookie_name: str, jwt_secret: str, verify_audience: bool
+) -> CookieBitmapExtractor:
+    from impresso_content_auth.strategy.extractor.cookie_bitmap_extractor import (
+        CookieBitmapExtractor,
+    )
+
+    return CookieBitmapExtractor(
+        cookie_name=cookie_name,
+        jwt_secret=jwt_secret,
+        verify_audience=verify_audience,
+    )
+
+
+def _make_cookie_user_id_extractor(
+    cookie_name: str, jwt_secret: str, verify_audience: bool
+) -> CookieUserIdExtractor:
+    from impresso_content_auth.strategy.extractor.cookie_user_id_extractor import (
+        CookieUserIdExtractor,
+    )
+
+    return CookieUserIdExtractor(
+        cookie_name=cookie_name,
+        jwt_secret=jwt_secret,
+        verify_audience=verify_audience,
+    )
+
+
+def _make_iiif_presentation_manifest_extractor() -> IIIFPresentationManifestExtractor:
+    from impresso_content_auth.strategy.extractor.iiif_presentation_manifest import (
+        IIIFPresentationManifestExtractor,
+        extract_url_from_x_original_uri,
+    )
+
+    return IIIFPresentationManifestExtractor(
+        url_extractor_func=extract_url_from_x_original_uri,
+    )
+
+
+def _make_iiif_uri_doc_id_extractor() -> IIIFUriDocIdExtractor:
+    from impresso_content_auth.strategy.extractor.iiif_uri_doc_id_extractor import (
+        IIIFUriDocIdExtractor,
+    )
+
+    return IIIFUriDocIdExtractor()
+
+
+def _make_equality_matcher() -> EqualityMatcher:
+    from impresso_content_auth.strategy.matcher.equality import EqualityMatcher
+
+    return EqualityMatcher()
+
+
+def _make_bitwise_and_matcher() -> BitWiseAndMatcherStrategy:
+    from impresso_content_auth.strategy.matcher.bitwise_and import (
+        BitWiseAndMatcherStrategy,
+    )
+
+    return BitWiseAndMatcherStrategy()
+
+
+def _make_quota_matcher(quota_checker, user_id_extractor, doc_id_extractor) -> QuotaMatcher:  # type: ignore[no-untyped-def]
+    from impresso_content_auth.strategy.matcher.quota_matcher import QuotaMatcher
+
+    return QuotaMatcher(
+        quota_checker=quota_checker,
+        user_id_extractor=user_id_extractor,
+        doc_id_extractor=doc_id_extractor,
+    )
 
 
 class AppConfiguration(providers.Configuration):
-    def is_manifest_with_secret_enabled(self) -> Literal["true", "false"]:
-        """Check if the manifest with secret extractor is enabled."""
-        return "true" if self.static_files_path() is not None else "false"
-
-    def is_static_secret_enabled(self) -> Literal["true", "false"]:
-        """Check if the static secret extractor is enabled."""
-        return "true" if self.static_secret() is not None else "false"
-
-    def is_cookie_bitmap_enabled(self) -> Literal["true", "false"]:
-        """Check if the cookie bitmap extractor is enabled."""
-        return "true" if self.jwt_secret() is not None else "false"
-
-    def is_solr_content_item_enabled(self) -> Literal["true", "false"]:
-        """Check if Solr is enabled."""
-        if (
-            self.solr.base_url() is not None
-            and self.solr.content_item_collection() is not None
-            and self.solr.username() is not None
-            and self.solr.password() is not None
-        ):
-            return "true"
-        return "false"
-
-    def is_redis_quota_checker_enabled(self) -> Literal["true", "false"]:
-        """Check if Redis quota checker is enabled."""
-        return "true" if self.redis.url() is not None else "false"
+    def jwt_verify_audience_bool(self) -> bool:
+        """Coerce the `jwt_verify_audience` option to a bool once."""
+        v = self.jwt_verify_audience()
+        return v.lower() == "true" if isinstance(v, str) else bool(v)
+
+
+# Plain module-level predicates keep Selector resolution out of the
+# providers.Configuration attribute-dispatch machinery: each call is a direct
+# function call on the already-bound configuration. The results only depend
+# on configuration values that are fixed after config loading, so they are
+# memoized per configuration instance.
+
+
+@cache
+def _is_manifest_with_secret_enabled(
+    config: AppConfiguration,
+) -> Literal["true", "false"]:
+    """Check if the manifest with secret extractor is enabled."""
+    return "true" if config.static_files_path() is not None else "false"
+
+
+@cache
+def _is_static_secret_enabled(config: AppConfiguration) -> Literal["true", "false"]:
+    """Check if the static secret extractor is enabled."""
+    return "true" if config.static_secret() is not None else "false"
+
+
+@cache
+def _is_cookie_bitmap_enabled(config: AppConfiguration) -> Literal["true", "false"]:
+    """Check if the cookie bitmap extractor is enabled."""
+    return "true" if config.jwt_secret() is not None else "false"
+
+
+@cache
+def _is_solr_content_item_enabled(config: AppConfiguration) -> Literal["true", "false"]:
+    """Check if Solr is enabled."""
+    if (
+        config.solr.base_url() is not None
+        and config.solr.content_item_collection() is not None
+        and config.solr.username() is not None
+        and config.solr.password() is not None
+    ):
+        return "true"
+    return "false"
+
+
+@cache
+def _is_redis_quota_checker_enabled(
+    config: AppConfiguration,
+) -> Literal["true", "false"]:
+    """Check if Redis quota checker is enabled."""
+    return "true" if config.redis.url() is not None else "false"
 
 
 class Container(containers.DeclarativeContainer):
@@ -69,20 +280,32 @@ class Container(containers.DeclarativeContainer):
 
     config = AppConfiguration()
 
-    null_extractor: providers.Singleton = providers.Singleton(NullExtractorStrategy)
-    null_matcher: providers.Singleton = providers.Singleton(NullMatcherStrategy)
+    # Disabled Selector branches resolve to None so startup code can skip
+    # them with a plain `is None` check instead of instantiating null
+    # strategies and isinstance-filtering them.
+    disabled: providers.Object = providers.Object(None)
 
-    redis_client: providers.Singleton = providers.Singleton(
-        redis.from_url,
+    # One shared connection pool for every Redis-backed component: clients
+    # wired off it reuse the same sockets instead of each growing their own
+    # pool, and shutdown has a single pool to disconnect.
+    redis_connection_pool: providers.Singleton = providers.Singleton(
+        _make_redis_connection_pool,
         url=config.redis.url,
     )
 
-    null_quota_checker: providers.Singleton[NullQuotaChecker] = providers.Singleton(NullQuotaChecker)
+    redis_client: providers.Singleton = providers.Singleton(
+        _make_redis_client,
+        connection_pool=redis_connection_pool,
+    )
+
+    null_quota_checker: providers.Singleton = providers.Singleton(
+        _make_null_quota_checker
+    )
 
     quota_checker: providers.Selector = providers.Selector(
-        config.is_redis_quota_checker_enabled,
+        partial(_is_redis_quota_checker_enabled, config),
         true=providers.Singleton(
-            RedisQuotaChecker,
+            _make_redis_quota_checker,
             redis_client=redis_client,
             quota_limit=config.redis.quota_limit.as_(int),
             window_seconds=config.redis.window_days.as_(lambda days: int(days) * 86400),
@@ -90,8 +313,8 @@ class Container(containers.DeclarativeContainer):
         false=null_quota_checker,
     )
 
-    solr_service: providers.Singleton[SolrService] = providers.Singleton(
-        SolrService,
+    solr_service: providers.Singleton = providers.Singleton(
+        _make_solr_service,
         base_url=config.solr.base_url,
         username=config.solr.username,
         password=config.solr.password,
@@ -100,91 +323,74 @@ class Container(containers.DeclarativeContainer):
 
     extractors: providers.Aggregate = providers.Aggregate(
         {
-            "bearer-token": providers.Singleton(BearerTokenExtractor),
+            "bearer-token": providers.Singleton(_make_bearer_token_extractor),
             "manifest-with-secret": providers.Selector(
-                config.is_manifest_with_secret_enabled,
+                partial(_is_manifest_with_secret_enabled, config),
                 true=providers.Singleton(
-                    ManifestWithSecretExtractor,
+                    _make_manifest_with_secret_extractor,
                     base_path=config.static_files_path,
                 ),
-                false=null_extractor,
+                false=disabled,
             ),
             "static-secret": providers.Selector(
-                config.is_static_secret_enabled,
+                partial(_is_static_secret_enabled, config),
                 true=providers.Singleton(
-                    StaticSecretExtractor,
+                    _make_static_secret_extractor,
                     secret=config.static_secret,
                 ),
-                false=null_extractor,
+                false=disabled,
             ),
             "content-item-image-bitmap": providers.Selector(
-                config.is_solr_content_item_enabled,
+                partial(_is_solr_content_item_enabled, config),
                 true=providers.Singleton(
-                    SolrDocumentExtractor,
+                    _make_solr_content_item_extractor,
                     solr_service=solr_service,
                     collection=config.solr.content_item_collection,
                     field="rights_bm_get_img_l",
-                    # - To match by page ID:
-                    # id_extractor_func=extract_id_from_x_original_uri_with_iiif,
-                    # solr_id_field="page_id_ss",
-                    # - To match by content item ID prefix:
-                    solr_id_field="id",
-                    id_extractor_func=extract_id_from_x_original_uri_with_iiif_and_wildcard_page_suffix,
                 ),
-                false=null_extractor,
+                false=disabled,
             ),
             "content-item-explore-bitmap": providers.Selector(
-                config.is_solr_content_item_enabled,
+                partial(_is_solr_content_item_enabled, config),
                 true=providers.Singleton(
-                    SolrDocumentExtractor,
+                    _make_solr_content_item_extractor,
                     solr_service=solr_service,
                     collection=config.solr.content_item_collection,
                     field="rights_bm_explore_l",
-                    # - To match by page ID:
-                    # id_extractor_func=extract_id_from_x_original_uri_with_iiif,
-                    # solr_id_field="page_id_ss",
-                    # - To match by content item ID prefix:
-                    solr_id_field="id",
-                    id_extractor_func=extract_id_from_x_original_uri_with_iiif_and_wildcard_page_suffix,
                 ),
-                false=null_extractor,
+                false=disabled,
             ),
             "cookie-bitmap": providers.Selector(
-                config.is_cookie_bitmap_enabled,
+                partial(_is_cookie_bitmap_enabled, config),
                 true=providers.Singleton(
-                    CookieBitmapExtractor,
+                    _make_cookie_bitmap_extractor,
                     cookie_name=config.cookie_name,
                     jwt_secret=config.jwt_secret,
-                    verify_audience=config.jwt_verify_audience.as_(
-                        lambda x: x.lower() == "true" if isinstance(x, str) else x
-                    ),
+                    verify_audience=providers.Callable(config.jwt_verify_audience_bool),
                 ),
-                false=null_extractor,
+                false=disabled,
             ),
             "iiif-presentation-manifest": providers.Singleton(
-                IIIFPresentationManifestExtractor,
-                url_extractor_func=extract_url_from_x_original_uri,
+                _make_iiif_presentation_manifest_extractor,
             ),
         }
     )
 
     matchers: providers.Aggregate = providers.Aggregate(
         {
-            "equality": providers.Singleton(EqualityMatcher),
-            "bitwise-and": providers.Singleton(BitWiseAndMatcherStrategy),
+            "equality": providers.Singleton(_make_equality_matcher),
+            "bitwise-and": providers.Singleton(_make_bitwise_and_matcher),
             "quota": providers.Singleton(
-                QuotaMatcher,
+                _make_quota_matcher,
                 quota_checker=quota_checker,
                 user_id_extractor=providers.Singleton(
-                    CookieUserIdExtractor,
+                    _make_cookie_user_id_extractor,
                     cookie_name=config.cookie_name,
                     jwt_secret=config.jwt_secret,
-                    verify_audience=config.jwt_verify_audience.as_(
-                        lambda x: x.lower() == "true" if isinstance(x, str) else x
-                    ),
+                    verify_audience=providers.Callable(config.jwt_verify_audience_bool),
                 ),
                 doc_id_extractor=providers.Singleton(
-                    IIIFUriDocIdExtractor,
+                    _make_iiif_uri_doc_id_extractor,
                 ),
             ),
         }
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Main entry point for the impresso-content-auth tool."""
 
-import argparse
 import sys
 
 
@@ -11,6 +10,8 @@ def main() -> int:
     Returns:
         An integer exit code.
     """
+    import argparse
+
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
         description="Impresso Content Authorization Tool"
     )
@@ -25,7 +26,15 @@ def main() -> int:
 
         port = int(os.environ.get("PORT", 8000))
         log_level = os.environ.get("LOG_LEVEL", "info").lower()
-        uvicorn.run(app, host="0.0.0.0", port=port, log_level=log_level)
+        uvicorn.run(
+            app,
+            host="0.0.0.0",
+            port=port,
+            log_level=log_level,
+            # C-backed event loop and HTTP parser instead of asyncio/h11.
+            loop="uvloop",
+            http="httptools",
+        )
     else:
         print("Impresso Content Authorization Tool")
         print("Use --server flag to start the web server")
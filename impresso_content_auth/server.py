@@ -1,11 +1,10 @@
 import asyncio
-import contextlib
 import logging
 import os
+from collections import Counter
 from pathlib import Path
-from typing import List
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
-from dotenv import load_dotenv
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
@@ -13,10 +12,47 @@ from starlette.routing import Route
 from starlette.status import HTTP_200_OK, HTTP_403_FORBIDDEN
 
 from impresso_content_auth.di import Container
+from impresso_content_auth.strategy.extractor.base import TokenExtractorStrategy
+from impresso_content_auth.strategy.matcher.base import TokenMatcherStrategy
 from impresso_content_auth.strategy.matcher.quota_matcher import QuotaMatcher
 
+try:
+    # libyaml-backed loader, considerably faster than the pure-Python one
+    from yaml import CSafeLoader as YamlConfigLoader
+except ImportError:  # pragma: no cover - libyaml not installed
+    from yaml import SafeLoader as YamlConfigLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# These responses carry no body and no dynamic headers, so single instances
+# can be reused across requests instead of allocating a Response per call.
+OK_RESPONSE: Response = Response(status_code=HTTP_200_OK)
+FORBIDDEN_RESPONSE: Response = Response(status_code=HTTP_403_FORBIDDEN)
+QUOTA_REACHED_RESPONSE: Response = Response(
+    status_code=HTTP_403_FORBIDDEN,
+    headers={"X-Redirect-Url": "https://http.cat/429"},
+)
+
+# Unknown strategy names are counted instead of logged per event so that a
+# burst of probe/misconfigured requests costs a dict increment, not log
+# formatting and handler I/O. A background task flushes the counts.
+_unknown_strategy_counter: "Counter[Tuple[str, str]]" = Counter()
+_UNKNOWN_FLUSH_INTERVAL_SECONDS: float = 30.0
+
+
+async def _flush_unknown_strategy_counts() -> None:
+    """Periodically emit one aggregated warning for unknown strategy names."""
+    while True:
+        await asyncio.sleep(_UNKNOWN_FLUSH_INTERVAL_SECONDS)
+        if _unknown_strategy_counter:
+            counts = dict(_unknown_strategy_counter)
+            _unknown_strategy_counter.clear()
+            logger.warning(
+                "Unknown strategy names in the last %ds: %s",
+                int(_UNKNOWN_FLUSH_INTERVAL_SECONDS),
+                counts,
+            )
+
 
 async def health(_request: Request) -> JSONResponse:
     """Health check endpoint.
@@ -28,47 +64,203 @@ async def health(_request: Request) -> JSONResponse:
     return JSONResponse({"status": "ok"})
 
 
-@contextlib.asynccontextmanager
-async def lifespan(app: Starlette):  # type: ignore
-    """Initialize the application and its components."""
+def _make_auth_handler(
+    matcher: TokenMatcherStrategy[Any],
+    client_token_extractor: TokenExtractorStrategy[Any],
+    resource_token_extractor: TokenExtractorStrategy[Any],
+    quota_matcher: Optional[QuotaMatcher] = None,
+) -> Callable[[Request], Awaitable[Response]]:
+    """Build an endpoint closed over one (matcher, client, resource) triple.
 
-    uvicorn_logger = logging.getLogger("uvicorn")
-    root_logger = logging.getLogger()
-    for handler in uvicorn_logger.handlers:
-        root_logger.addHandler(handler)
+    The returned handler skips path-parameter parsing and strategy lookup
+    entirely: all strategies are already-resolved singletons.
+    """
+    use_gather = client_token_extractor.is_async and resource_token_extractor.is_async
+
+    async def handler(request: Request) -> Response:
+        if quota_matcher is not None:
+            # Overlap the quota round-trip with the extractor awaits instead
+            # of serializing them: the extraction work runs anyway whenever
+            # quota passes, so it is only wasted on the rare denial.
+            quota_not_reached, client_token, resource_token = await asyncio.gather(
+                quota_matcher(request),
+                client_token_extractor(request),
+                resource_token_extractor(request),
+            )
+            if not quota_not_reached:
+                logger.info("Quota reached for request: %s", request.url.path)
+                return QUOTA_REACHED_RESPONSE
+        elif use_gather:
+            client_token, resource_token = await asyncio.gather(
+                client_token_extractor(request),
+                resource_token_extractor(request),
+            )
+        else:
+            client_token = await client_token_extractor(request)
+            resource_token = await resource_token_extractor(request)
 
-    load_dotenv()
-    app.state.container = Container()
-    app.state.container.config.from_yaml(Path(__file__).parent / "config.yml")
+        if client_token is None or resource_token is None:
+            return FORBIDDEN_RESPONSE
 
-    log_level = app.state.container.config.log_level().upper()
-    root_logger.setLevel(log_level)
-    logger.info(f"Starting Impresso Content Auth server with log level {log_level}...")
+        return (
+            OK_RESPONSE
+            if matcher(client_token, resource_token)
+            else FORBIDDEN_RESPONSE
+        )
 
-    for name, extractor_provider in app.state.container.extractors.providers.items():
-        extractor = extractor_provider()
-        logger.info(
-            "Configured extractor: %s: %s",
-            name,
-            extractor,
+    return handler
+
+
+class Lifespan:
+    """Application lifespan implemented as a bare async context manager.
+
+    Avoids the generator state machine (and the contextlib import) that
+    `@asynccontextmanager` would add for this one-time startup/shutdown path.
+    """
+
+    def __init__(self, app: Starlette):
+        self.app = app
+        self._precompiled_route_count = 0
+        self._flush_task: "asyncio.Task[None] | None" = None
+
+    async def __aenter__(self) -> None:
+        """Initialize the application and its components."""
+        app = self.app
+
+        uvicorn_logger = logging.getLogger("uvicorn")
+        root_logger = logging.getLogger()
+        for handler in uvicorn_logger.handlers:
+            root_logger.addHandler(handler)
+
+        # Production sets its environment via the orchestrator; only walk the
+        # filesystem for a .env file when explicitly asked to.
+        if os.environ.get("LOAD_DOTENV") == "1":
+            from dotenv import load_dotenv
+
+            load_dotenv()
+        app.state.container = Container()
+        app.state.container.config.from_yaml(
+            Path(__file__).parent / "config.yml", loader=YamlConfigLoader
         )
 
-    for name, matcher_provider in app.state.container.matchers.providers.items():
-        matcher = matcher_provider()
+        log_level = app.state.container.config.log_level().upper()
+        root_logger.setLevel(log_level)
         logger.info(
-            "Configured matcher: %s: %s",
-            name,
-            matcher,
+            f"Starting Impresso Content Auth server with log level {log_level}..."
         )
 
-    yield
-    # Cleanup logic if needed
-    logger.info("Shutting down Impresso Content Auth server...")
+        # Resolve all singletons once and expose them as plain dicts so the
+        # per-request path is a single dict lookup instead of a provider call.
+        # Disabled strategies resolve to None and are dropped here, so neither
+        # the dicts nor the precompiled routes ever see them.
+        app.state.extractors = {
+            name: extractor
+            for name, provider in app.state.container.extractors.providers.items()
+            if (extractor := provider()) is not None
+        }
+        for name, extractor in app.state.extractors.items():
+            logger.info(
+                "Configured extractor: %s: %s",
+                name,
+                extractor,
+            )
+
+        app.state.matchers = {
+            name: matcher
+            for name, provider in app.state.container.matchers.providers.items()
+            if (matcher := provider()) is not None
+        }
+        for name, matcher in app.state.matchers.items():
+            logger.info(
+                "Configured matcher: %s: %s",
+                name,
+                matcher,
+            )
+
+        # Precompile one static route per (matcher, client, resource) triple
+        # so the hot path is a static route match straight onto
+        # already-resolved singletons. The dynamic routes stay registered as
+        # a fallback that answers requests with unknown names with a 403.
+        quota_matcher = app.state.matchers.get("quota")
+        precompiled: List[Route] = []
+        # Also expose the triples as a tuple-keyed lookup table so the
+        # dynamic fallback route resolves a request with one dict lookup.
+        app.state.resolved = {}
+        for matcher_name, matcher in app.state.matchers.items():
+            for client_name, client_extractor in app.state.extractors.items():
+                for resource_name, resource_extractor in app.state.extractors.items():
+                    app.state.resolved[(matcher_name, client_name, resource_name)] = (
+                        matcher,
+                        client_extractor,
+                        resource_extractor,
+                        # Decide once per triple whether gather is worth it.
+                        client_extractor.is_async and resource_extractor.is_async,
+                    )
+                    prefix = f"/{matcher_name}/{client_name}/{resource_name}"
+                    precompiled.append(
+                        Route(
+                            prefix,
+                            endpoint=_make_auth_handler(
+                                matcher, client_extractor, resource_extractor
+                            ),
+                        )
+                    )
+                    precompiled.append(
+                        Route(
+                            prefix + "/with-quota-check",
+                            endpoint=_make_auth_handler(
+                                matcher,
+                                client_extractor,
+                                resource_extractor,
+                                quota_matcher=quota_matcher,
+                            ),
+                        )
+                    )
+        # Insert after the /health route, ahead of the dynamic fallback routes.
+        app.router.routes[1:1] = precompiled
+        self._precompiled_route_count = len(precompiled)
+        logger.info("Precompiled %d static auth routes", len(precompiled))
+
+        self._flush_task = asyncio.create_task(_flush_unknown_strategy_counts())
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        # Close network clients owned by the resolved singletons. The shared
+        # SolrService is closed once even when several extractors reference it.
+        seen: set = set()
+        for extractor in self.app.state.extractors.values():
+            for closeable in (getattr(extractor, "solr_service", None), extractor):
+                if (
+                    closeable is not None
+                    and id(closeable) not in seen
+                    and hasattr(closeable, "close")
+                ):
+                    seen.add(id(closeable))
+                    await closeable.close()
+        # Disconnect the shared Redis pool if the quota matcher was wired up
+        # with a Redis-backed checker.
+        quota_matcher = self.app.state.matchers.get("quota")
+        redis_client = getattr(
+            getattr(quota_matcher, "quota_checker", None), "redis_client", None
+        )
+        if redis_client is not None:
+            await redis_client.aclose(close_connection_pool=True)
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        del self.app.router.routes[1 : 1 + self._precompiled_route_count]
+        logger.info("Shutting down Impresso Content Auth server...")
 
 
 async def auth_check(request: Request, check_quota: bool) -> Response:
     """Authorization check endpoint."""
-    if logger.level <= logging.DEBUG:
+    # isEnabledFor respects the effective (inherited) level and caches the
+    # answer, so the guard itself is cheap; it keeps the header mapping and
+    # argument tuple from being built at all on the common non-debug path.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
         logger.debug(
             "Authorization check for %s %s (%s)",
             request.method,
@@ -76,71 +268,80 @@ async def auth_check(request: Request, check_quota: bool) -> Response:
             request.headers,
         )
 
-    container: Container = request.app.state.container
+    app_state = request.app.state
 
-    # 1 check quota if requested
-    if check_quota:
-        quota_matcher_init = container.matchers.providers.get("quota")
-        if quota_matcher_init:
-            quota_matcher: QuotaMatcher = quota_matcher_init()
-            quota_not_reached = await quota_matcher(request)
-            if not quota_not_reached:
-                logger.info("Quota reached for request: %s", request.url.path)
-                return Response(
-                    status_code=HTTP_403_FORBIDDEN,
-                    headers={"X-Redirect-Url": "https://http.cat/429"}
-                )
-
-
-    client_token_extractor_name = request.path_params.get("client_token_extractor")
-    resource_token_extractor_name = request.path_params.get("resource_token_extractor")
+    # The route pattern guarantees all three path params, so index directly.
+    path_params = request.path_params
+    client_token_extractor_name = path_params["client_token_extractor"]
+    resource_token_extractor_name = path_params["resource_token_extractor"]
+    matcher_name = path_params["matcher"]
 
-    # Get the token extractor strategy based on the request
-    client_token_extractor = container.extractors.providers.get(
-        client_token_extractor_name or ""
+    # Resolve the whole triple with a single lookup in the precomputed table
+    # and bail out before doing any extraction work on a miss (common for
+    # probe requests).
+    entry = app_state.resolved.get(
+        (matcher_name, client_token_extractor_name, resource_token_extractor_name)
     )
-    resource_token_extractor = container.extractors.providers.get(
-        resource_token_extractor_name or ""
+    if entry is None:
+        # Count instead of logging: this is the hot path for probe and
+        # misconfigured requests; the counts are flushed periodically.
+        if client_token_extractor_name not in app_state.extractors:
+            _unknown_strategy_counter[("client", client_token_extractor_name)] += 1
+        if resource_token_extractor_name not in app_state.extractors:
+            _unknown_strategy_counter[("resource", resource_token_extractor_name)] += 1
+        if matcher_name not in app_state.matchers:
+            _unknown_strategy_counter[("matcher", matcher_name)] += 1
+        return FORBIDDEN_RESPONSE
+
+    matcher, client_token_extractor, resource_token_extractor, use_gather = entry
+
+    # Check quota only after the strategy names validated: requests with
+    # unknown strategies never cost a Redis round-trip. The quota round-trip
+    # itself is overlapped with the extractor awaits (see _make_auth_handler).
+    quota_matcher: "QuotaMatcher | None" = (
+        app_state.matchers.get("quota") if check_quota else None
     )
-    if not client_token_extractor or not resource_token_extractor:
-        if not client_token_extractor:
-            logger.warning(
-                "No extractor found for client token: %s",
-                client_token_extractor_name,
-            )
-        if not resource_token_extractor:
-            logger.warning(
-                "No extractor found for resource token: %s",
-                resource_token_extractor_name,
-            )
-        return Response(status_code=HTTP_403_FORBIDDEN)
-
-    client_token_extractor = client_token_extractor()
-    resource_token_extractor = resource_token_extractor()
-
-    matcher_name = request.path_params.get("matcher")
-    matcher = container.matchers.providers.get(matcher_name or "")
-    if not matcher:
-        logger.warning("No matcher found for: %s", matcher_name)
-        return Response(status_code=HTTP_403_FORBIDDEN)
-
-    matcher = matcher()
-
-    client_token, resource_token = await asyncio.gather(
-        client_token_extractor(request),
-        resource_token_extractor(request),
-    )
-    logger.debug("Extracted client token: %s using %s (%s)", client_token, client_token_extractor, client_token_extractor_name)
-    logger.debug("Extracted resource token: %s using %s (%s)", resource_token, resource_token_extractor, resource_token_extractor_name)
+    if quota_matcher is not None:
+        quota_not_reached, client_token, resource_token = await asyncio.gather(
+            quota_matcher(request),
+            client_token_extractor(request),
+            resource_token_extractor(request),
+        )
+        if not quota_not_reached:
+            logger.info("Quota reached for request: %s", request.url.path)
+            return QUOTA_REACHED_RESPONSE
+    elif use_gather:
+        # Only schedule tasks when both extractors actually suspend on I/O;
+        # otherwise a plain sequential await is cheaper.
+        client_token, resource_token = await asyncio.gather(
+            client_token_extractor(request),
+            resource_token_extractor(request),
+        )
+    else:
+        client_token = await client_token_extractor(request)
+        resource_token = await resource_token_extractor(request)
+    if debug_enabled:
+        # Guarded: formatting the extractor reprs (__str__ walks their full
+        # configuration) is far more expensive than the calls themselves.
+        logger.debug(
+            "Extracted client token: %s using %s (%s)",
+            client_token,
+            client_token_extractor,
+            client_token_extractor_name,
+        )
+        logger.debug(
+            "Extracted resource token: %s using %s (%s)",
+            resource_token,
+            resource_token_extractor,
+            resource_token_extractor_name,
+        )
 
     if client_token is None or resource_token is None:
         # If either token is None, we can't proceed with the comparison
-        return Response(status_code=HTTP_403_FORBIDDEN)
+        return FORBIDDEN_RESPONSE
 
-    return Response(
-        status_code=(
-            HTTP_200_OK if matcher(client_token, resource_token) else HTTP_403_FORBIDDEN
-        )
+    return (
+        OK_RESPONSE if matcher(client_token, resource_token) else FORBIDDEN_RESPONSE
     )
 
 async def auth_check_no_quota_check(request: Request) -> Response:
@@ -161,10 +362,21 @@ routes: List[Route] = [
     ),
 ]
 
-app: Starlette = Starlette(debug=True, routes=routes, lifespan=lifespan)
+# Debug mode adds traceback-rendering middleware to every request; keep it
+# off unless explicitly enabled.
+DEBUG: bool = os.environ.get("DEBUG") == "1"
+
+app: Starlette = Starlette(debug=DEBUG, routes=routes, lifespan=Lifespan)
 
 if __name__ == "__main__":
     import uvicorn
 
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port, access_log=False)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        access_log=False,
+        loop="uvloop",
+        http="httptools",
+    )
@@ -3,9 +3,10 @@
 import logging
 from pathlib import Path
 from time import time
-from typing import Literal
+from typing import Literal, Tuple
 
 import redis.asyncio as redis
+from cachetools import TTLCache
 
 from impresso_content_auth.service.quota_checker.base import QuotaChecker
 
@@ -37,18 +38,58 @@ class RedisQuotaChecker(QuotaChecker):
         self.redis_client: redis.Redis = redis_client
         self.quota_limit = quota_limit
         self.window_seconds = window_seconds
-        self._lua_script: str | None = None
-
-    def _load_lua_script(self) -> str:
-        """Load the Lua script for quota checking."""
-        if self._lua_script is not None:
-            return self._lua_script
 
+        # Register the script so calls go over the wire as a 40-byte EVALSHA
+        # instead of shipping (and re-compiling) the full script body per
+        # request; redis-py falls back to SCRIPT LOAD automatically.
         script_path = Path(__file__).parent / "resources" / "quotaCheck.lua"
         with open(script_path, "r") as f:
-            self._lua_script = f.read()
+            self._script = redis_client.register_script(f.read())
+
+        # Short-lived cache of positive results: repeat hits for the same
+        # (user, doc) pair within a few seconds (pagination, thumbnails,
+        # reloads) skip the Redis round-trip. Only "below_quota" is cached;
+        # a previously seen document stays allowed even at quota, so a
+        # cached positive can never mask a denial.
+        self._recent: TTLCache[Tuple[str, str], int] = TTLCache(maxsize=100_000, ttl=10)
+
+    def _keys(self, user_id: str) -> list:
+        """Redis keys for a user, in the order the Lua script expects them."""
+        return [
+            f"user:{user_id}:bloom",
+            f"user:{user_id}:count",
+            f"user:{user_id}:first_access",
+        ]
+
+    @staticmethod
+    def parse_result(result: list) -> Literal["below_quota", "quota_reached"]:
+        """Map a raw Lua script result to the quota outcome."""
+        # result[0] is allowed flag: 1 = allowed, 0 = denied
+        return "below_quota" if int(result[0]) == 1 else "quota_reached"
+
+    async def check_in_pipeline(
+        self, pipe: redis.client.Pipeline, user_id: str, doc_id: str
+    ) -> None:
+        """
+        Queue the quota check onto an existing Redis pipeline.
+
+        Lets callers batch the quota check with other Redis-backed checks so
+        they all share one round-trip. The caller executes the pipeline and
+        maps this command's slot in the execute() results through
+        parse_result(). The short-lived positive cache is deliberately not
+        consulted here: skipping the command would shift the result offsets
+        the caller relies on.
 
-        return self._lua_script
+        Args:
+            pipe: Pipeline to queue the command on (not executed here)
+            user_id: Unique user identifier
+            doc_id: Unique document identifier
+        """
+        await self._script(
+            keys=self._keys(user_id),
+            args=[doc_id, self.quota_limit, int(time()), self.window_seconds],
+            client=pipe,
+        )
 
     async def __call__(
         self, user_id: str, doc_id: str
@@ -64,31 +105,22 @@ class RedisQuotaChecker(QuotaChecker):
             "below_quota" if access is allowed
             "quota_reached" if quota limit has been hit for new documents
         """
-        # Prepare Redis keys
-        bloom_key = f"user:{user_id}:bloom"
-        count_key = f"user:{user_id}:count"
-        first_access_key = f"user:{user_id}:first_access"
-
-        # Load the Lua script
-        script_content = self._load_lua_script()
+        if (user_id, doc_id) in self._recent:
+            return "below_quota"
 
         try:
-            # Execute Lua script
+            # Execute Lua script via EVALSHA
             # Keys: bloom_key, count_key, first_access_key
             # Args: doc_id, quota_limit, current_timestamp, window_seconds
-            current_timestamp = int(time())
-            keys = [bloom_key, count_key, first_access_key]
-            args = [doc_id, str(self.quota_limit), str(current_timestamp), str(self.window_seconds)]
-
-            result: list = await self.redis_client.eval(script_content, len(keys), *keys, *args)  # type: ignore
-
-            # result[0] is allowed flag: 1 = allowed, 0 = denied
-            allowed = int(result[0]) == 1
+            result: list = await self._script(
+                keys=self._keys(user_id),
+                args=[doc_id, self.quota_limit, int(time()), self.window_seconds],
+            )
 
-            if allowed:
-                return "below_quota"
-            else:
-                return "quota_reached"
+            outcome = self.parse_result(result)
+            if outcome == "below_quota":
+                self._recent[(user_id, doc_id)] = 1
+            return outcome
 
         except redis.ResponseError as e:
             # Handle Redis errors (e.g., Bloom filter module not installed)
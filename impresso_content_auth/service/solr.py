@@ -2,24 +2,67 @@
 Service module for interacting with Solr using httpx.
 """
 
-import json
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional, Union, cast
-from cachetools import TTLCache
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from cachetools import LRUCache
 
 import httpx
+import orjson
 from httpx import Limits, Timeout
 
 logger = logging.getLogger(__name__)
 
-def _get_post_key(url: str, json_data: Dict[str, Any]) -> str:
-    """Generates a unique, hashable key from the URL and sorted JSON data."""
-    # 1. Sort the JSON data to ensure consistent key generation 
-    #    (order of keys shouldn't matter for the cache)
-    sorted_json_str = json.dumps(json_data, sort_keys=True)
-    
-    # 2. Combine the URL and the sorted JSON string
-    return f"{url}:{sorted_json_str}"
+# Copying a pre-initialized context is cheaper than hashlib re-running
+# parameterized initialization for every key computation.
+_BLAKE_PROTO = hashlib.blake2b(digest_size=16)
+
+
+def _get_post_key(url: str, content: bytes) -> bytes:
+    """Generates a unique, hashable key from the URL and serialized body."""
+    # Hash to a fixed 16-byte digest so large filter queries don't blow up
+    # key size or dict-hashing cost
+    h = _BLAKE_PROTO.copy()
+    h.update(url.encode())
+    h.update(b"\x00")
+    h.update(content)
+    return h.digest()
+
+
+@lru_cache(maxsize=1024)
+def _build_body(
+    q: str,
+    fq: Optional[Union[str, Tuple[str, ...]]],
+    fields: Optional[Tuple[str, ...]],
+    rows: int,
+    start: int,
+    sort: Optional[str],
+) -> bytes:
+    """Build and serialize a Solr JSON query body.
+
+    All arguments are hashable, so repeated query shapes (the common case
+    when proxying) reuse the pre-serialized bytes instead of re-allocating
+    the body dict and re-joining the field list on every call. Keys are
+    sorted so equal queries always serialize to the same bytes.
+    """
+    body: Dict[str, Any] = {"query": q, "limit": rows, "offset": start}
+
+    # Nothing here reads the responseHeader echo, so ask Solr to omit it
+    # and shave bytes off every response before they reach the parser.
+    params: Dict[str, Any] = {"omitHeader": True}
+
+    if fq:
+        params["fq"] = list(fq) if isinstance(fq, tuple) else fq
+    if fields:
+        params["fl"] = ",".join(fields)
+    if sort:
+        params["sort"] = sort
+
+    body["params"] = params
+
+    return orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
 
 class SolrService:
     """
@@ -54,9 +97,14 @@ class SolrService:
             max_keepalive_connections=max_keepalive_connections,
         )
 
-        self.client = httpx.Client(
+        # http2=True is negotiated via ALPN: against an h2-capable Solr
+        # front-end (envoy/nginx) concurrent queries multiplex over a few
+        # connections instead of queueing per keep-alive connection, and
+        # plain HTTP/1.1 servers keep working unchanged.
+        self.client = httpx.AsyncClient(
             timeout=Timeout(timeout),
             limits=limits,
+            http2=True,
             headers={"Content-Type": "application/json"},
             auth=(
                 httpx.BasicAuth(username=username, password=password)
@@ -66,8 +114,17 @@ class SolrService:
             proxy=proxy_url,
         )
         self._proxy_url = proxy_url
+        # Only a handful of (collection, handler) pairs are ever used; cache
+        # the formatted query URLs instead of rebuilding the string per call.
+        self._url_cache: Dict[tuple[str, str], str] = {}
         self._auth_credentials = (username, password) if username and password else None
-        self._cache = TTLCache[str, str](maxsize=10000, ttl=3600)
+        # Stores the parsed response dict directly; callers only read from it,
+        # so a hit is a pointer copy rather than a json.loads pass.
+        # Plain LRU with an inline expiry timestamp per entry: O(1) per
+        # operation with no TTL bookkeeping, while stale entries are still
+        # refused on read (access bitmaps do change on republication).
+        self._cache_ttl_seconds: float = 3600.0
+        self._cache: LRUCache = LRUCache(maxsize=10000)
 
     @property
     def authentication_details(self) -> str | None:
@@ -83,19 +140,14 @@ class SolrService:
         """Get the proxy URL if configured."""
         return self._proxy_url
 
-    def __del__(self) -> None:
-        """Ensure the client is closed when the service is garbage collected."""
-        if hasattr(self, "client"):
-            self.client.close()
-
-    def close(self) -> None:
+    async def close(self) -> None:
         """Close the httpx client explicitly."""
-        self.client.close()
+        await self.client.aclose()
 
-    def post_query(
+    async def post_query(
         self,
         collection: str,
-        body: Dict[str, Any],
+        body: Union[Dict[str, Any], bytes],
         handler: str = "select",
     ) -> Dict[str, Any]:
         """
@@ -103,7 +155,8 @@ class SolrService:
 
         Args:
             collection: Name of the Solr collection
-            body: Request body to send to Solr
+            body: Request body to send to Solr, either a dict or
+                pre-serialized JSON bytes (e.g. from _build_body)
             handler: Solr request handler (default: 'select')
 
         Returns:
@@ -114,17 +167,30 @@ class SolrService:
             httpx.RequestError: On request errors
             ValueError: On invalid responses
         """
-        url = f"{self.base_url}/{collection}/{handler}"
+        url = self._url_cache.get((collection, handler))
+        if url is None:
+            url = f"{self.base_url}/{collection}/{handler}"
+            self._url_cache[(collection, handler)] = url
 
-        cached_response = self._cache.get(_get_post_key(url, body))
-        if cached_response is not None:
-            logger.debug(
-                "Cache hit for Solr POST request to collection '%s' at %s with body: %s",
-                collection,
-                url,
-                body,
-            )
-            return cast(Dict[str, Any], json.loads(cached_response))
+        content = (
+            body
+            if isinstance(body, bytes)
+            else orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
+        )
+        cache_key = _get_post_key(url, content)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_response = cached
+            if expires_at > monotonic():
+                logger.debug(
+                    "Cache hit for Solr POST request to collection '%s' at %s with body: %s",
+                    collection,
+                    url,
+                    body,
+                )
+                return cast(Dict[str, Any], cached_response)
+            # Expired: drop it now so the slot doesn't count against the LRU.
+            del self._cache[cache_key]
 
         try:
             logger.debug(
@@ -133,13 +199,13 @@ class SolrService:
                 url,
                 body,
             )
-            response = self.client.post(
+            response = await self.client.post(
                 url,
-                json=body,
+                content=content,
             )
             response.raise_for_status()
-            result = cast(Dict[str, Any], response.json())
-            self._cache[_get_post_key(url, body)] = json.dumps(result)
+            result = cast(Dict[str, Any], orjson.loads(response.content))
+            self._cache[cache_key] = (monotonic() + self._cache_ttl_seconds, result)
             return result
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -149,12 +215,12 @@ class SolrService:
                 response.text,
             )
             raise e
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             raise ValueError(
                 f"Invalid JSON response from Solr: {response.text}"
             ) from exc
 
-    def search(
+    async def search(
         self,
         collection: str,
         q: str = "*:*",
@@ -179,18 +245,15 @@ class SolrService:
         Returns:
             Parsed JSON response from Solr
         """
-        body = {"query": q, "limit": rows, "offset": start}
-
-        params: Dict[str, Any] = {}
-
-        if fq:
-            params["fq"] = fq
-        if fields:
-            params["fl"] = ",".join(fields)
-        if sort:
-            params["sort"] = sort
-
-        if params:
-            body["params"] = params
+        # Normalize list arguments to tuples so the memoized body builder
+        # can hash them; repeated query shapes hit pre-serialized bytes.
+        body = _build_body(
+            q,
+            tuple(fq) if isinstance(fq, list) else fq,
+            tuple(fields) if fields is not None else None,
+            rows,
+            start,
+            sort,
+        )
 
-        return self.post_query(collection, body)
+        return await self.post_query(collection, body)
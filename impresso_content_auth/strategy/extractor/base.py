@@ -11,15 +11,38 @@ class TokenExtractorStrategy(Protocol[T_co]):
     This protocol defines a method for extracting tokens from requests.
     """
 
+    __slots__ = ()
+
+    # Whether `__call__` actually suspends on I/O. Extractors that resolve
+    # without awaiting can be run sequentially, skipping the task scheduling
+    # overhead of `asyncio.gather`.
+    is_async: bool = False
+
     async def __call__(self, request: Request) -> Optional[T_co]: ...
 
 
+class SyncTokenExtractorStrategy(Protocol[T_co]):
+    """
+    Protocol for token extraction strategies that resolve without awaiting.
+    Extractors whose work is pure parsing implement this variant so callers
+    skip the per-call coroutine allocation an async `__call__` would force.
+    """
+
+    __slots__ = ()
+
+    is_async: bool = False
+
+    def __call__(self, request: Request) -> Optional[T_co]: ...
+
+
 class NullExtractorStrategy(TokenExtractorStrategy[None]):
     """
     A null extractor strategy that always returns None.
     This is used when no token extraction is needed.
     """
 
+    __slots__ = ()
+
     async def __call__(self, request: Request) -> None:
         """Always return None regardless of the request."""
         return None
@@ -6,6 +6,12 @@ from impresso_content_auth.strategy.extractor.base import (
     TokenExtractorStrategy,
 )
 
+# Starlette stores headers as lowercase bytes pairs; comparing bytes
+# directly skips the per-call key normalization and value decoding that
+# headers.get() performs.
+_AUTHORIZATION_HEADER = b"authorization"
+_BEARER_SCHEME = b"bearer"
+
 
 class BearerTokenExtractor(TokenExtractorStrategy[Optional[str]]):
     """
@@ -26,17 +32,24 @@ class BearerTokenExtractor(TokenExtractorStrategy[Optional[str]]):
             The bearer token as a string, or None if no valid bearer token
             is found.
         """
-        auth_header = request.headers.get("Authorization")
+        auth_header = None
+        for key, value in request.headers.raw:
+            if key == _AUTHORIZATION_HEADER:
+                auth_header = value
+                break
 
-        if not auth_header:
+        if auth_header is None:
             return None
 
+        # Whitespace split into exactly two parts, matching the original
+        # str-level acceptance rules: any ASCII whitespace between scheme
+        # and token (tabs included), no whitespace inside the token. Only
+        # the 6-byte scheme is lowercased, never the token.
         parts = auth_header.split()
-
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        if len(parts) != 2 or parts[0].lower() != _BEARER_SCHEME:
             return None
 
-        return parts[1]
+        return parts[1].decode("latin-1")
 
     def __str__(self) -> str:
         """Return a string representation of the extractor."""
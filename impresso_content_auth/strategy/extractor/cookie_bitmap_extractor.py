@@ -5,7 +5,11 @@ from starlette.requests import Request
 
 from impresso_content_auth.strategy.extractor.base import TokenExtractorStrategy
 from impresso_content_auth.utils.bitmap import BitMask64
-from impresso_content_auth.utils.jwt_utils import validate_jwt, get_bitmap
+from impresso_content_auth.utils.jwt_utils import (
+    get_bitmap,
+    get_forwarded_audience,
+    validate_jwt,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,18 +63,9 @@ class CookieBitmapExtractor(TokenExtractorStrategy[Optional[BitMask64]]):
             logger.warning("Cookie '%s' not found in request", self.cookie_name)
             return None
 
-        # Get audience from the request
-        fwd_host = request.headers.get("x-forwarded-host")
-        fwd_proto = request.headers.get("x-forwarded-proto")
-        fwd_port = request.headers.get("x-forwarded-port")
-
-        if fwd_host and fwd_proto:
-            port_part = (
-                f":{fwd_port}" if fwd_port and fwd_port not in ["80", "443"] else ""
-            )
-            audience = f"{fwd_proto}://{fwd_host}{port_part}"
-        else:
-            audience = None
+        # Get audience from the request (memoized on request.state, so the
+        # companion user-id extractor reuses the same string)
+        audience = get_forwarded_audience(request)
 
         # Validate the JWT token
         token_content = validate_jwt(
@@ -6,7 +6,10 @@ from typing import Optional
 from starlette.requests import Request
 
 from impresso_content_auth.strategy.extractor.base import TokenExtractorStrategy
-from impresso_content_auth.utils.jwt_utils import validate_jwt
+from impresso_content_auth.utils.jwt_utils import (
+    get_forwarded_audience,
+    validate_jwt,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,18 +61,9 @@ class CookieUserIdExtractor(TokenExtractorStrategy[Optional[str]]):
             logger.warning("Cookie '%s' not found in request", self.cookie_name)
             return None
 
-        # Get audience from the request
-        fwd_host = request.headers.get("x-forwarded-host")
-        fwd_proto = request.headers.get("x-forwarded-proto")
-        fwd_port = request.headers.get("x-forwarded-port")
-
-        if fwd_host and fwd_proto:
-            port_part = (
-                f":{fwd_port}" if fwd_port and fwd_port not in ["80", "443"] else ""
-            )
-            audience = f"{fwd_proto}://{fwd_host}{port_part}"
-        else:
-            audience = None
+        # Get audience from the request (memoized on request.state, so the
+        # companion bitmap extractor reuses the same string)
+        audience = get_forwarded_audience(request)
 
         # Validate the JWT token
         token_content = validate_jwt(
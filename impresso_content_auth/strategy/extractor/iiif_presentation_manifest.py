@@ -2,23 +2,48 @@
 Strategy module for extracting tokens from IIIF Presentation API manifests.
 """
 
+import asyncio
 import logging
-from typing import Callable, Generic, Optional, TypeVar, cast
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar, cast
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from dacite import from_dict
+import orjson
+from cachetools import TTLCache
 from starlette.requests import Request
 
-from impresso_content_auth.models.generated.iiifPresentationContext import (
-    IiifPresentationApiV3ManifestSchema,
-)
 from impresso_content_auth.strategy.extractor.base import TokenExtractorStrategy
 from impresso_content_auth.utils.bitmap import BitMask64
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+_H_ORIGINAL_URI = "x-original-uri"
+_H_FORWARDED_HOST = "x-forwarded-host"
+_H_FORWARDED_PROTO = "x-forwarded-proto"
+
+
+@lru_cache(maxsize=4096)
+def _derive_manifest_url(file_url: str, manifest_path: str) -> str:
+    """Replace the last path component of a file URL with the manifest path.
+
+    Pure transformation of a highly repetitive input set, so the
+    urlparse/urljoin work is memoized at module level.
+    """
+    parsed_url = urlparse(file_url)
+    path_parts = parsed_url.path.rsplit("/", 1)
+
+    if len(path_parts) > 1:
+        # Replace the file name with manifest path
+        base_path = path_parts[0]
+        return urljoin(
+            f"{parsed_url.scheme}://{parsed_url.netloc}{base_path}/",
+            manifest_path,
+        )
+    # If there's no path separator, just append manifest path
+    return urljoin(file_url, manifest_path)
+
 
 class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMask64]):
     """
@@ -31,6 +56,8 @@ class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMa
     4. Extracts bitmap tokens from the manifest's metadata
     """
 
+    is_async = True
+
     def __init__(
         self,
         url_extractor_func: Callable[[Request], Optional[str]],
@@ -51,8 +78,26 @@ class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMa
         self.metadata_field = metadata_field
         self.manifest_path = manifest_path
         self.timeout = timeout
-        # Create a httpx client with timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        # HTTP/2 multiplexes concurrent manifest fetches over a few
+        # connections, and a generous keepalive pool avoids TCP/TLS setup on
+        # repeated fetches from the same IIIF host. Asking for compressed
+        # responses shrinks the (often large) manifest JSON on the wire.
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=500,
+                max_keepalive_connections=200,
+                keepalive_expiry=30.0,
+            ),
+            headers={"Accept-Encoding": "gzip, br"},
+        )
+        # Extracted bitmaps keyed by manifest URL: the same manifest is
+        # requested repeatedly per document, and the bitmap is a few bytes
+        # against kilobytes of manifest JSON. Failures are not cached.
+        self._bitmap_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        # Per-URL locks coalesce concurrent misses into a single fetch.
+        self._fetch_locks: Dict[str, asyncio.Lock] = {}
 
     async def __call__(self, request: Request) -> Optional[BitMask64]:
         """
@@ -72,6 +117,32 @@ class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMa
 
         # Get manifest URL by replacing the file path with manifest path
         manifest_url = self._get_manifest_url(file_url)
+
+        cached = self._bitmap_cache.get(manifest_url)
+        if cached is not None:
+            return cast(BitMask64, cached)
+
+        # Coalesce concurrent cache misses for the same manifest into one
+        # fetch; waiters find the result in the cache once the lock frees.
+        lock = self._fetch_locks.setdefault(manifest_url, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._bitmap_cache.get(manifest_url)
+                if cached is not None:
+                    return cast(BitMask64, cached)
+                return await self._fetch_and_extract(manifest_url)
+        finally:
+            self._fetch_locks.pop(manifest_url, None)
+
+    async def _fetch_and_extract(self, manifest_url: str) -> Optional[BitMask64]:
+        """Fetch a manifest and extract its bitmap, caching successes.
+
+        Args:
+            manifest_url: The URL of the manifest file
+
+        Returns:
+            The extracted token or None if not found
+        """
         logger.debug("Fetching manifest from: %s", manifest_url)
 
         try:
@@ -85,7 +156,9 @@ class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMa
             bitmap = self._extract_bitmap_from_manifest(manifest)
             if bitmap:
                 logger.debug("Extracted bitmap: %s", bitmap)
-                return BitMask64(bitmap)
+                result = BitMask64(bitmap)
+                self._bitmap_cache[manifest_url] = result
+                return result
             else:
                 logger.debug("No bitmap found in manifest metadata: %s", manifest)
                 return None
@@ -107,28 +180,17 @@ class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMa
         Returns:
             The URL of the manifest file
         """
-        parsed_url = urlparse(file_url)
-        path_parts = parsed_url.path.rsplit("/", 1)
-
-        if len(path_parts) > 1:
-            # Replace the file name with manifest path
-            base_path = path_parts[0]
-            manifest_url = urljoin(
-                f"{parsed_url.scheme}://{parsed_url.netloc}{base_path}/",
-                self.manifest_path,
-            )
-        else:
-            # If there's no path separator, just append manifest path
-            manifest_url = urljoin(file_url, self.manifest_path)
-
-        return manifest_url
-
-    async def _fetch_manifest(
-        self, url: str
-    ) -> Optional[IiifPresentationApiV3ManifestSchema]:
+        return _derive_manifest_url(file_url, self.manifest_path)
+
+    async def _fetch_manifest(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Fetch and parse a IIIF Presentation manifest from a URL using httpx.
 
+        The manifest is returned as the raw parsed dict: only a handful of
+        keys are ever read, so reflectively materializing the full nested
+        schema (dozens of dataclasses via dacite) would be wasted work on
+        the request hot path.
+
         Args:
             url: The URL of the manifest file
 
@@ -145,18 +207,18 @@ class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMa
                 )
                 return None
 
-            return cast(
-                IiifPresentationApiV3ManifestSchema,
-                from_dict(
-                    data_class=IiifPresentationApiV3ManifestSchema, data=response.json()
-                ),
-            )
+            # Parse the raw bytes with orjson rather than response.json():
+            # manifests can be large and this is the hot path on cache misses.
+            return cast(Dict[str, Any], orjson.loads(response.content))
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid manifest JSON (%s): %s", url, str(e))
+            return None
         except httpx.RequestError as e:
             logger.error("Error fetching manifest (%s): %s", url, str(e))
             raise
 
     def _extract_bitmap_from_manifest(
-        self, manifest: IiifPresentationApiV3ManifestSchema
+        self, manifest: Dict[str, Any]
     ) -> Optional[str]:
         """
         Extract the bitmap value from a manifest's metadata.
@@ -169,27 +231,29 @@ class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMa
         """
         try:
             # Navigate through manifest structure to find items
-            if not manifest.items:
+            items = manifest.get("items")
+            if not items:
                 return None
 
             # Look for metadata in the first canvas
-            canvas = manifest.items[0]
-            if not canvas.metadata:
+            metadata = items[0].get("metadata")
+            if not metadata:
                 return None
 
             # Find metadata item matching the target field
-            for item in canvas.metadata:
-                if not item.label:
+            for item in metadata:
+                label = item.get("label")
+                if not label:
                     continue
 
                 # Check if the label matches our target field in any language
-                for lang_values in item.label.values():
+                for lang_values in label.values():
                     if not isinstance(lang_values, list):
                         continue
 
                     if self.metadata_field in lang_values:
                         # Get the value from the first language we find
-                        for lang_bitmap_values in item.value.values():
+                        for lang_bitmap_values in item.get("value", {}).values():
                             if (
                                 isinstance(lang_bitmap_values, list)
                                 and lang_bitmap_values
@@ -210,6 +274,14 @@ class IIIFPresentationManifestExtractor(Generic[T], TokenExtractorStrategy[BitMa
         """Close the httpx client explicitly."""
         await self.client.aclose()
 
+    async def __aenter__(self) -> "IIIFPresentationManifestExtractor[T]":
+        """Enter the async context, returning the extractor itself."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the httpx client when leaving the context."""
+        await self.close()
+
     def __str__(self) -> str:
         """Return a string representation of the extractor."""
         return (
@@ -230,19 +302,19 @@ def extract_url_from_x_original_uri(request: Request) -> Optional[str]:
     Returns:
         The extracted URL or None if not found
     """
-    path = request.headers.get("x-original-uri", "")
+    path = request.headers.get(_H_ORIGINAL_URI, "")
     if not path:
         logger.debug("No 'x-original-uri' header found in request")
         return None
 
     # Extract the host from headers
-    host = request.headers.get("x-forwarded-host", "")
+    host = request.headers.get(_H_FORWARDED_HOST, "")
     if not host:
         logger.debug("No 'host' header found in request")
         return None
 
     # Determine scheme (http or https)
-    scheme = request.headers.get("x-forwarded-proto") or "https"
+    scheme = request.headers.get(_H_FORWARDED_PROTO) or "https"
 
     # Construct full URL
     full_url = f"{scheme}://{host}{path}"
@@ -5,7 +5,7 @@ from typing import Optional
 
 from starlette.requests import Request
 
-from impresso_content_auth.strategy.extractor.base import TokenExtractorStrategy
+from impresso_content_auth.strategy.extractor.base import SyncTokenExtractorStrategy
 from impresso_content_auth.strategy.extractor.solr_document import (
     extract_id_from_x_original_uri_with_iiif,
 )
@@ -13,17 +13,22 @@ from impresso_content_auth.strategy.extractor.solr_document import (
 logger = logging.getLogger(__name__)
 
 
-class IIIFUriDocIdExtractor(TokenExtractorStrategy[Optional[str]]):
+class IIIFUriDocIdExtractor(SyncTokenExtractorStrategy[Optional[str]]):
     """
     Extractor that gets document ID from IIIF URI in x-original-uri header.
 
     Extracts the document ID from the x-original-uri header, handling IIIF paths.
     """
 
-    async def __call__(self, request: Request) -> Optional[str]:
+    def __call__(self, request: Request) -> Optional[str]:
         """
         Extract document ID from IIIF URI in x-original-uri header.
 
+        Plain def (via SyncTokenExtractorStrategy): the body is pure string
+        parsing, so declaring it async would only add a coroutine allocation
+        per call. Callers that accept both kinds of extractor (e.g.
+        QuotaMatcher) detect this at wiring time.
+
         Args:
             request: The incoming HTTP request
 
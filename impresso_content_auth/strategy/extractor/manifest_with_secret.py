@@ -1,14 +1,42 @@
-import json
 import os
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 from starlette.requests import Request
 
 from impresso_content_auth.strategy.extractor.base import (
     TokenExtractorStrategy,
 )
 
+_H_ORIGINAL_URI = "x-original-uri"
+
+
+@lru_cache(maxsize=1024)
+def _load_manifest_secret(manifest_path: str, mtime_ns: int) -> Optional[str]:
+    """Read and parse a manifest file, returning its secret.
+
+    Cached per (path, mtime): static manifests rarely change, so repeat
+    requests skip the disk read and JSON parse entirely, while an edited
+    file gets a new mtime and therefore a fresh read.
+
+    Args:
+        manifest_path: Path to the manifest file.
+        mtime_ns: The file's st_mtime_ns at lookup time (cache key only).
+
+    Returns:
+        The secret as a string, or None if not found.
+    """
+    try:
+        # Binary read + orjson: no text decoding pass before parsing.
+        with open(manifest_path, "rb") as f:
+            manifest = orjson.loads(f.read())
+
+        secret = manifest.get("secret")
+        return str(secret) if secret is not None else None
+    except (IOError, orjson.JSONDecodeError):
+        return None
+
 
 class ManifestWithSecretExtractor(TokenExtractorStrategy[Optional[str]]):
     """
@@ -41,7 +69,7 @@ class ManifestWithSecretExtractor(TokenExtractorStrategy[Optional[str]]):
             manifest is found or it doesn't contain a secret.
         """
         # Get the original URI that was requested
-        original_uri = request.headers.get("x-original-uri", "")
+        original_uri = request.headers.get(_H_ORIGINAL_URI, "")
 
         if not original_uri:
             return None
@@ -51,13 +79,16 @@ class ManifestWithSecretExtractor(TokenExtractorStrategy[Optional[str]]):
         if not file_path:
             return None
 
-        # Determine the manifest path
+        # Determine the manifest path. A single stat both checks existence
+        # and yields the mtime that keys the manifest cache.
         manifest_path = self._get_manifest_path(file_path)
-        if not os.path.exists(manifest_path):
+        try:
+            stat_result = os.stat(manifest_path)
+        except OSError:
             return None
 
         # Read the manifest and extract the secret
-        return self._extract_secret_from_manifest(manifest_path)
+        return _load_manifest_secret(manifest_path, stat_result.st_mtime_ns)
 
     def _uri_to_path(self, uri: str) -> Optional[str]:
         """Convert a URI to a file path.
@@ -68,8 +99,9 @@ class ManifestWithSecretExtractor(TokenExtractorStrategy[Optional[str]]):
         Returns:
             The absolute file path or None if invalid.
         """
-        # Remove any query parameters or fragments
-        uri_path = uri.split("?")[0].split("#")[0]
+        # Remove any query parameters or fragments; partition avoids the
+        # intermediate lists that split() would allocate per request
+        uri_path = uri.partition("?")[0].partition("#")[0]
 
         # Remove leading slash to make it relative to base_path
         if uri_path.startswith("/"):
@@ -86,32 +118,13 @@ class ManifestWithSecretExtractor(TokenExtractorStrategy[Optional[str]]):
         Returns:
             The path to the corresponding manifest file.
         """
-        # Extract path without extension
-        path_obj = Path(file_path)
-        file_name = path_obj.stem
-        directory = path_obj.parent
-
-        # Create manifest file path
-        manifest_file = f"{file_name}_manifest.json"
-        return os.path.join(directory, manifest_file)
-
-    def _extract_secret_from_manifest(self, manifest_path: str) -> Optional[str]:
-        """Extract the secret from a manifest file.
-
-        Args:
-            manifest_path: Path to the manifest file.
-
-        Returns:
-            The secret as a string, or None if not found.
-        """
-        try:
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                manifest = json.load(f)
-
-            secret = manifest.get("secret")
-            return str(secret) if secret is not None else None
-        except (IOError, json.JSONDecodeError):
-            return None
+        # Strip the extension of the last component and append the manifest
+        # suffix; plain rfind scans instead of Path stem/parent allocations.
+        dot = file_path.rfind(".")
+        slash = file_path.rfind("/")
+        if dot > slash:
+            return file_path[:dot] + "_manifest.json"
+        return file_path + "_manifest.json"
 
     def __str__(self) -> str:
         """Return a string representation of the extractor."""
@@ -2,10 +2,12 @@
 Strategy module for extracting tokens from Solr documents.
 """
 
+import asyncio
 import logging
-import re
-from typing import Callable, Generic, Optional, TypeVar
+from functools import lru_cache
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
 
+from cachetools import TTLCache
 from starlette.requests import Request
 
 from impresso_content_auth.service.solr import SolrService
@@ -15,6 +17,42 @@ from impresso_content_auth.utils.bitmap import BitMask64
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+# Hot-path header names as module constants: the literals are interned
+# once and every call site shares the same lookup key.
+_H_ORIGINAL_URI = "x-original-uri"
+_H_PREFIX_STRIP = "x-prefix-strip"
+
+# Lucene query syntax characters, escaped via str.translate in one pass.
+_SOLR_ESCAPE_TABLE = {ord(c): "\\" + c for c in '+-&|!(){}[]^"~*?:\\/ '}
+
+
+@lru_cache(maxsize=32)
+def _compile_prefixes(header: str) -> Tuple[str, ...]:
+    """Split an x-prefix-strip header into a prefix tuple.
+
+    The header value is deployment configuration and only takes a handful of
+    distinct values, so the split is memoized instead of re-allocating the
+    list per request.
+    """
+    return tuple(header.split(","))
+
+
+def _escape_solr_term(term: str) -> str:
+    """Escape Lucene query special characters in a query term.
+
+    A single trailing ``*`` is preserved: the wildcard page-suffix ID
+    extractor appends it intentionally to match any page of a content item.
+
+    Args:
+        term: The raw term (e.g. a document ID from a request header)
+
+    Returns:
+        The term with special characters backslash-escaped
+    """
+    if term.endswith("*"):
+        return term[:-1].translate(_SOLR_ESCAPE_TABLE) + "*"
+    return term.translate(_SOLR_ESCAPE_TABLE)
+
 
 class SolrDocumentExtractor(Generic[T], TokenExtractorStrategy[BitMask64]):
     """
@@ -26,6 +64,8 @@ class SolrDocumentExtractor(Generic[T], TokenExtractorStrategy[BitMask64]):
     3. Extracts the token from the document using a provided extractor function
     """
 
+    is_async = True
+
     def __init__(
         self,
         solr_service: SolrService,
@@ -48,6 +88,24 @@ class SolrDocumentExtractor(Generic[T], TokenExtractorStrategy[BitMask64]):
         self.id_extractor_func = id_extractor_func
         self.field = field
         self.solr_id_field = solr_id_field
+        # Extracted field values keyed by (collection, doc_id, field): repeat
+        # requests for the same document skip the Solr round-trip entirely.
+        # Misses (document or field absent) are remembered separately with a
+        # short TTL so missing docs don't hammer Solr but recover quickly.
+        self._cache: TTLCache[Tuple[str, str, str], BitMask64] = TTLCache(
+            maxsize=50000, ttl=300
+        )
+        self._negative_cache: TTLCache[Tuple[str, str, str], bool] = TTLCache(
+            maxsize=10000, ttl=10
+        )
+        # Per-key locks coalesce concurrent misses into a single query.
+        self._fetch_locks: Dict[Tuple[str, str, str], asyncio.Lock] = {}
+        # Micro-batcher state: concurrent lookups for different exact IDs
+        # within a ~1ms window are merged into a single terms query.
+        self._batch: Dict[str, "asyncio.Future[Optional[dict]]"] = {}
+        self._batch_timer: Optional["asyncio.Future[None]"] = None
+        self._max_batch_size = 64
+        self._max_batch_wait_seconds = 0.001
 
     async def __call__(self, request: Request) -> Optional[BitMask64]:
         """
@@ -65,25 +123,66 @@ class SolrDocumentExtractor(Generic[T], TokenExtractorStrategy[BitMask64]):
             logger.debug("No document ID extracted from request URL")
             return None
 
+        key = (self.collection, doc_id, self.field)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        if key in self._negative_cache:
+            return None
+
+        lock = self._fetch_locks.setdefault(key, asyncio.Lock())
         try:
-            # Query Solr for the document
-            query = f"{self.solr_id_field}:{doc_id}"
-            response = self.solr_service.search(
-                collection=self.collection,
-                q=query,
-                fields=[self.field],
-                rows=1,
-            )
+            async with lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+                if key in self._negative_cache:
+                    return None
+
+                result = await self._fetch_token(doc_id)
+                if result is not None:
+                    self._cache[key] = result
+                else:
+                    self._negative_cache[key] = True
+                return result
+        finally:
+            self._fetch_locks.pop(key, None)
+
+    async def _fetch_token(self, doc_id: str) -> Optional[BitMask64]:
+        """Query Solr for a document and extract the configured field.
+
+        Exact IDs go through the micro-batcher so concurrent lookups for
+        different documents share one Solr request; wildcard IDs (from the
+        page-suffix extractor) cannot use the terms parser and are queried
+        individually.
 
-            # Extract document from response
-            docs = response.get("response", {}).get("docs", [])
-            if not docs:
+        Args:
+            doc_id: The document ID to look up
+
+        Returns:
+            The extracted token or None if not found
+        """
+        try:
+            # Commas would corrupt the terms-query join, so such IDs also
+            # take the individual (escaped) query path.
+            if "*" in doc_id or "," in doc_id:
+                document = await self._query_single(doc_id)
+            else:
+                document = await self._enqueue_batched(doc_id)
+
+            if document is None:
                 logger.debug("No document found with ID '%s'", doc_id)
                 return None
 
-            # Extract token from document
-            document = docs[0]
-            return BitMask64(document.get(self.field, None))
+            # Extract token from document; an absent field is a miss, not
+            # an error, and lands in the negative cache like a missing doc.
+            value = document.get(self.field)
+            if value is None:
+                logger.debug(
+                    "Field '%s' not present on document '%s'", self.field, doc_id
+                )
+                return None
+            return BitMask64(value)
 
         except (ConnectionError, TimeoutError) as e:
             logger.error("Network error while querying Solr: %s", str(e))
@@ -92,6 +191,74 @@ class SolrDocumentExtractor(Generic[T], TokenExtractorStrategy[BitMask64]):
             logger.error("Error processing Solr response: %s", str(e))
             raise
 
+    async def _query_single(self, doc_id: str) -> Optional[dict]:
+        """Run one id-field query and return the first matching document."""
+        # Query Solr for the document. The ID comes from request headers,
+        # so escape it: unescaped Solr syntax characters cause parse
+        # failures and let callers influence the query structure.
+        query = f"{self.solr_id_field}:{_escape_solr_term(doc_id)}"
+        response = await self.solr_service.search(
+            collection=self.collection,
+            q=query,
+            fields=[self.field],
+            rows=1,
+        )
+
+        docs = response.get("response", {}).get("docs", [])
+        return docs[0] if docs else None
+
+    def _enqueue_batched(self, doc_id: str) -> "asyncio.Future[Optional[dict]]":
+        """Register a doc ID with the current batch and return its future.
+
+        The first enqueue of a batch arms a short timer; the batch fires when
+        the timer expires or the batch is full, whichever comes first, as one
+        terms-parser query. Duplicate IDs in a window share one future.
+        """
+        future = self._batch.get(doc_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._batch[doc_id] = future
+            if len(self._batch) >= self._max_batch_size:
+                if self._batch_timer is not None:
+                    self._batch_timer.cancel()
+                    self._batch_timer = None
+                asyncio.ensure_future(self._run_batch())
+            elif self._batch_timer is None:
+                self._batch_timer = asyncio.ensure_future(self._fire_batch_later())
+        return future
+
+    async def _fire_batch_later(self) -> None:
+        """Run the pending batch after the collection window elapses."""
+        await asyncio.sleep(self._max_batch_wait_seconds)
+        self._batch_timer = None
+        await self._run_batch()
+
+    async def _run_batch(self) -> None:
+        """Issue one terms query for the pending batch and fan results out."""
+        batch, self._batch = self._batch, {}
+        if not batch:
+            return
+
+        try:
+            # The terms query parser does a raw multi-term lookup with no
+            # query-syntax parsing, so the IDs need no escaping here.
+            query = f"{{!terms f={self.solr_id_field}}}{','.join(batch)}"
+            response = await self.solr_service.search(
+                collection=self.collection,
+                q=query,
+                fields=[self.field, self.solr_id_field],
+                rows=len(batch),
+            )
+            docs = response.get("response", {}).get("docs", [])
+            docs_by_id = {doc.get(self.solr_id_field): doc for doc in docs}
+            for doc_id, future in batch.items():
+                if not future.done():
+                    future.set_result(docs_by_id.get(doc_id))
+        except Exception as exc:  # noqa: BLE001 - every waiter must resolve
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+
     def __str__(self) -> str:
         """Return a string representation of the extractor."""
         return (
@@ -117,21 +284,21 @@ def extract_id_from_x_original_uri(request: Request) -> Optional[str]:
     Returns:
         The extracted document ID or None if not found
     """
-    path = request.headers.get("x-original-uri", "")
+    path = request.headers.get(_H_ORIGINAL_URI, "")
     if not path:
         logger.debug("No 'x-original-uri' header found in request")
         return None
 
-    # Match the last path component and extract the ID before the file extension
-    match = re.search(r"/([^/]+)\.[\w]+$", path)
-    if not match:
+    # Take the last path component up to the file extension. Plain rfind
+    # scans instead of a regex: this runs per request and the pattern is
+    # trivially positional.
+    slash = path.rfind("/")
+    dot = path.rfind(".")
+    if slash < 0 or dot <= slash + 1 or dot == len(path) - 1:
         logger.debug("Could not extract ID from URL path: %s", path)
         return None
 
-    # Extract the filename without extension and remove any suffix after the last dash
-    id_match = match.group(1)
-
-    return id_match
+    return path[slash + 1 : dot]
 
 
 def extract_id_from_x_original_uri_with_iiif(request: Request) -> Optional[str]:
@@ -149,14 +316,14 @@ def extract_id_from_x_original_uri_with_iiif(request: Request) -> Optional[str]:
     Returns:
         The extracted document ID or None if not found
     """
-    path = request.headers.get("x-original-uri", "")
+    path = request.headers.get(_H_ORIGINAL_URI, "")
     if not path:
         logger.debug("No 'x-original-uri' header found in request")
         return None
 
-    if request.headers.get("x-prefix-strip"):
-        prefixes = request.headers.get("x-prefix-strip", "").split(",")
-        for prefix in prefixes:
+    prefix_header = request.headers.get(_H_PREFIX_STRIP)
+    if prefix_header:
+        for prefix in _compile_prefixes(prefix_header):
             if path.startswith(prefix):
                 path = path[len(prefix) :]  # noqa
                 logger.debug("Stripped prefix '%s' from path: %s", prefix, path)
@@ -200,6 +367,11 @@ def extract_id_from_x_original_uri_with_iiif_and_wildcard_page_suffix(
     if not id_with_page:
         return None
 
-    # Replace page suffix (p followed by digits) at the end of the string with *
-    # We look for -p\d+$ pattern
-    return re.sub(r"-p\d+$", "-*", id_with_page)
+    # Replace a trailing page suffix (-p followed by digits) with -*.
+    # Scanning backwards avoids the regex engine on the request hot path.
+    i = len(id_with_page)
+    while i > 0 and id_with_page[i - 1].isdigit():
+        i -= 1
+    if i < len(id_with_page) and id_with_page[i - 2 : i] == "-p":
+        return id_with_page[: i - 2] + "-*"
+    return id_with_page
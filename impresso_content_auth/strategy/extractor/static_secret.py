@@ -13,6 +13,8 @@ class StaticSecretExtractor(TokenExtractorStrategy[str]):
     during initialization, regardless of the request details.
     """
 
+    __slots__ = ("secret",)
+
     def __init__(self, secret: str):
         """Initialize the static secret extractor with a predefined secret.
 
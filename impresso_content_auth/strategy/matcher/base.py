@@ -11,6 +11,8 @@ class TokenMatcherStrategy(Protocol[T]):
     Returns True if the tokens match, False otherwise.
     """
 
+    __slots__ = ()
+
     def __call__(self, a: T, b: T) -> bool: ...
 
 
@@ -20,6 +22,8 @@ class NullMatcherStrategy(TokenMatcherStrategy[T]):
     This is used when no token matching is needed.
     """
 
+    __slots__ = ()
+
     def __call__(self, a: T, b: T) -> bool:
         """Always return False regardless of the tokens."""
         return False
@@ -2,7 +2,7 @@ from typing import TypeVar
 import logging
 
 from impresso_content_auth.strategy.matcher.base import TokenMatcherStrategy
-from impresso_content_auth.utils.bitmap import BitMask64, is_access_allowed
+from impresso_content_auth.utils.bitmap import BitMask64
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,8 @@ class BitWiseAndMatcherStrategy(TokenMatcherStrategy[BitMask64]):
     if their bitwise AND operation results in a non-zero value.
     """
 
+    __slots__ = ()
+
     def __call__(self, a: BitMask64, b: BitMask64) -> bool:
         """
         Perform a bitwise AND operation on two integers.
@@ -31,17 +33,28 @@ class BitWiseAndMatcherStrategy(TokenMatcherStrategy[BitMask64]):
             value if threshold is None), False otherwise.
         """
         try:
-            access_is_allowed = is_access_allowed(a, b)
-            if access_is_allowed:
-                logger.debug(
-                    "BitWiseAnd match succeeded: %s & %s = %s", a, b, access_is_allowed
-                )
-            else:
-                logger.debug(
-                    "BitWiseAnd match failed: %s & %s = %s", a, b, access_is_allowed
-                )
+            # Read the underlying ints directly: this runs once per
+            # authorization check, and the attribute reads plus one AND
+            # skip the is_access_allowed call frame and the __int__
+            # dunder dispatch per operand.
+            access_is_allowed = (a._value & b._value) != 0
+            if logger.isEnabledFor(logging.DEBUG):
+                if access_is_allowed:
+                    logger.debug(
+                        "BitWiseAnd match succeeded: %s & %s = %s",
+                        a,
+                        b,
+                        access_is_allowed,
+                    )
+                else:
+                    logger.debug(
+                        "BitWiseAnd match failed: %s & %s = %s",
+                        a,
+                        b,
+                        access_is_allowed,
+                    )
             return access_is_allowed
-        except (TypeError, ValueError) as e:
+        except (TypeError, ValueError, AttributeError) as e:
             logger.warning("BitWiseAnd match failed: %s", str(e))
             return False
 
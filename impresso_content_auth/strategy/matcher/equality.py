@@ -11,6 +11,8 @@ class EqualityMatcher:
     Returns True if the tokens are equal, False otherwise.
     """
 
+    __slots__ = ()
+
     def __call__(self, a: T, b: T) -> bool:
         return a == b
 
@@ -1,15 +1,27 @@
 """Quota matcher that checks if a user is within their quota for a document."""
 
+import asyncio
+import inspect
 import logging
-from typing import Optional
+from typing import Awaitable, Optional, Union, cast
 
 from starlette.requests import Request
 
 from impresso_content_auth.service.quota_checker.base import QuotaChecker
-from impresso_content_auth.strategy.extractor.base import TokenExtractorStrategy
+from impresso_content_auth.strategy.extractor.base import (
+    SyncTokenExtractorStrategy,
+    TokenExtractorStrategy,
+)
 
 logger = logging.getLogger(__name__)
 
+# The ID extractors may be async (network-backed) or plain callables
+# (pure string parsing); which one applies is detected once at wiring time.
+IdExtractorStrategy = Union[
+    TokenExtractorStrategy[Optional[str]],
+    SyncTokenExtractorStrategy[Optional[str]],
+]
+
 
 class QuotaMatcher:
     """
@@ -21,11 +33,20 @@ class QuotaMatcher:
     3. Returns True if access is allowed (below quota), False if quota is reached
     """
 
+    __slots__ = (
+        "quota_checker",
+        "user_id_extractor",
+        "doc_id_extractor",
+        "_user_id_is_async",
+        "_doc_id_is_async",
+        "_gather_ids",
+    )
+
     def __init__(
         self,
         quota_checker: QuotaChecker,
-        user_id_extractor: TokenExtractorStrategy[Optional[str]],
-        doc_id_extractor: TokenExtractorStrategy[Optional[str]],
+        user_id_extractor: IdExtractorStrategy,
+        doc_id_extractor: IdExtractorStrategy,
     ):
         """
         Initialize the quota matcher.
@@ -38,6 +59,15 @@ class QuotaMatcher:
         self.quota_checker = quota_checker
         self.user_id_extractor = user_id_extractor
         self.doc_id_extractor = doc_id_extractor
+        # Decide once at wiring time which extractors are coroutines:
+        # extractors that only do string parsing are plain callables and
+        # skip the per-call coroutine allocation entirely.
+        self._user_id_is_async = inspect.iscoroutinefunction(user_id_extractor.__call__)
+        self._doc_id_is_async = inspect.iscoroutinefunction(doc_id_extractor.__call__)
+        # When both extractors do real awaiting (e.g. Solr or manifest
+        # fetches), run them concurrently; gather is pure overhead when
+        # either side is a plain string-parsing callable.
+        self._gather_ids = self._user_id_is_async and self._doc_id_is_async
 
     async def __call__(self, request: Request) -> bool:
         """
@@ -53,9 +83,30 @@ class QuotaMatcher:
             False if the user has reached their quota (access denied)
         """
         try:
-            # Extract user ID and document ID from request
-            user_id = await self.user_id_extractor(request)
-            doc_id = await self.doc_id_extractor(request)
+            # Extract user ID and document ID from request; the two are
+            # independent, so overlap their I/O when both are coroutines.
+            # The casts restate what the wiring-time is-async detection
+            # guarantees about each union member.
+            if self._gather_ids:
+                user_id, doc_id = await asyncio.gather(
+                    cast("Awaitable[Optional[str]]", self.user_id_extractor(request)),
+                    cast("Awaitable[Optional[str]]", self.doc_id_extractor(request)),
+                )
+            else:
+                user_id = (
+                    await cast(
+                        "Awaitable[Optional[str]]", self.user_id_extractor(request)
+                    )
+                    if self._user_id_is_async
+                    else cast(Optional[str], self.user_id_extractor(request))
+                )
+                doc_id = (
+                    await cast(
+                        "Awaitable[Optional[str]]", self.doc_id_extractor(request)
+                    )
+                    if self._doc_id_is_async
+                    else cast(Optional[str], self.doc_id_extractor(request))
+                )
 
             # Check if both were extracted
             if not user_id or not doc_id:
@@ -70,14 +121,16 @@ class QuotaMatcher:
             result = await self.quota_checker(user_id, doc_id)
 
             if result == "below_quota":
-                logger.debug(
-                    "User %s is within quota for document %s", user_id, doc_id
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "User %s is within quota for document %s", user_id, doc_id
+                    )
                 return True
             else:  # quota_reached
-                logger.debug(
-                    "User %s has reached quota for document %s", user_id, doc_id
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "User %s has reached quota for document %s", user_id, doc_id
+                    )
                 return False
 
         except Exception as e:
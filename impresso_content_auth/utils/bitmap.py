@@ -13,7 +13,11 @@ class BitMask64:
 
     def __init__(self, value: str | int | bytes = 0, reverse: bool = False):
         if isinstance(value, str):
-            if not all(c in "01" for c in value):
+            # strip("01") is a single C-level scan: anything left over is an
+            # invalid character. Replaces the per-character Python loop, and
+            # also keeps int(value, 2) from accepting its looser syntax
+            # (signs, surrounding whitespace, underscores).
+            if value.strip("01"):
                 raise ValueError("String must contain only '0' and '1'")
             if len(value) > 64:
                 raise ValueError("String must contain maximum 64 characters")
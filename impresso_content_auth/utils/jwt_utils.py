@@ -1,12 +1,124 @@
 import base64
+import hashlib
 import jwt
 import logging
-from typing import Dict, Optional, Any, cast
+import orjson
+from time import time
+from typing import Dict, Optional, Any, Union, cast
+
+from cachetools import TTLCache
+from starlette.requests import Request
 
 from impresso_content_auth.utils.bitmap import BitMask64
 
 logger = logging.getLogger(__name__)
 
+# Session cookies repeat the same token across many requests, so signature
+# verification (HMAC + base64 + JSON decode per call) is mostly redundant
+# work. Validated claims are cached for a short window, shared by every
+# caller of validate_jwt. Keys are digests of the full validation input, so
+# raw tokens are never stored, and failed validations are never cached.
+_VALIDATED_TTL_SECONDS = 30
+_validated_cache: TTLCache = TTLCache(maxsize=10000, ttl=_VALIDATED_TTL_SECONDS)
+
+# Copying a pre-initialized context is cheaper than hashlib re-running
+# parameterized initialization for every key computation.
+_BLAKE_PROTO = hashlib.blake2b(digest_size=16)
+
+
+def _validation_key(
+    token: str,
+    secret: str,
+    audience: str | None,
+    algorithms: list[str] | None,
+    verify_audience: bool,
+) -> bytes:
+    """Digest of every input that can change the validation outcome."""
+    h = _BLAKE_PROTO.copy()
+    h.update(token.encode())
+    h.update(b"\x00")
+    h.update(secret.encode())
+    h.update(b"\x00")
+    h.update((audience or "").encode())
+    h.update(b"\x00")
+    h.update(",".join(algorithms or ()).encode())
+    h.update(b"\x01" if verify_audience else b"\x00")
+    return h.digest()
+
+
+def get_forwarded_audience(request: Request) -> Optional[str]:
+    """
+    Derive the expected JWT audience URL from the x-forwarded-* headers.
+
+    Memoized on request.state so that when several extractors run for the
+    same request the audience string is only built once.
+
+    Args:
+        request: The incoming HTTP request
+
+    Returns:
+        The audience URL, or None if the forwarding headers are missing
+    """
+    state = request.state
+    try:
+        return cast(Optional[str], state._audience)
+    except AttributeError:
+        pass
+
+    # One pass over the raw header list instead of three .get() scans;
+    # Starlette stores keys as lowercase bytes.
+    fwd_host = fwd_proto = fwd_port = None
+    for key, value in request.headers.raw:
+        if key == b"x-forwarded-host":
+            fwd_host = value.decode("latin-1")
+        elif key == b"x-forwarded-proto":
+            fwd_proto = value.decode("latin-1")
+        elif key == b"x-forwarded-port":
+            fwd_port = value.decode("latin-1")
+
+    audience: Optional[str]
+    if fwd_host and fwd_proto:
+        if fwd_port and fwd_port not in ("80", "443"):
+            audience = f"{fwd_proto}://{fwd_host}:{fwd_port}"
+        else:
+            audience = f"{fwd_proto}://{fwd_host}"
+    else:
+        audience = None
+
+    state._audience = audience
+    return audience
+
+
+def _peek_exp(token: str) -> Optional[Union[int, float]]:
+    """Best-effort read of the unverified exp claim of a JWT.
+
+    Lets validate_jwt reject already-expired tokens with a base64 decode and
+    JSON parse instead of paying for signature verification first. Returns
+    None when the token is malformed or carries no numeric exp; those cases
+    fall through to full validation for a proper error.
+
+    Args:
+        token: The raw JWT string
+
+    Returns:
+        The exp claim as a number, or None if it cannot be read
+    """
+    first_dot = token.find(".")
+    second_dot = token.find(".", first_dot + 1)
+    if first_dot < 0 or second_dot < 0:
+        return None
+
+    payload_segment = token[first_dot + 1 : second_dot]
+    try:
+        payload = orjson.loads(
+            base64.urlsafe_b64decode(payload_segment + "=" * (-len(payload_segment) % 4))
+        )
+    except ValueError:
+        return None
+
+    exp = payload.get("exp") if isinstance(payload, dict) else None
+    return exp if isinstance(exp, (int, float)) else None
+
 
 def validate_jwt(
     token: str,
@@ -29,6 +141,25 @@ def validate_jwt(
     if algorithms is None:
         algorithms = ["HS256"]
 
+    cache_key = _validation_key(token, secret, audience, algorithms, verify_audience)
+    cached = _validated_cache.get(cache_key)
+    if cached is not None:
+        # Re-check expiry locally so a token never outlives its exp claim
+        # just because it sits in the cache.
+        exp = cached.get("exp")
+        if exp is None or exp > time():
+            return cast(Dict[str, Any], cached)
+        del _validated_cache[cache_key]
+        logger.warning("JWT validation failed: token has expired")
+        return None
+
+    # Reject clearly expired tokens before paying for signature
+    # verification; replayed stale session cookies are the common case.
+    peeked_exp = _peek_exp(token)
+    if peeked_exp is not None and peeked_exp <= time():
+        logger.warning("JWT validation failed: token has expired")
+        return None
+
     try:
         payload = jwt.decode(
             token,
@@ -37,6 +168,7 @@ def validate_jwt(
             audience=audience,
             options={"verify_exp": True, "verify_aud": verify_audience},
         )
+        _validated_cache[cache_key] = payload
         return cast(Dict[str, Any], payload)
     except jwt.ExpiredSignatureError:
         logger.warning("JWT validation failed: token has expired")
@@ -60,7 +192,8 @@ def get_bitmap(
     Returns:
         The bitmap value as a long if found, None otherwise
     """
-    if key in token_content and isinstance(token_content[key], str):
-        decoded = base64.b64decode(token_content[key])
+    value = token_content.get(key)
+    if isinstance(value, str):
+        decoded = base64.b64decode(value)
         return BitMask64(decoded)
     return None
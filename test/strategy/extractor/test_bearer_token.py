@@ -0,0 +1,68 @@
+"""
+Tests for the bearer token extractor.
+
+These pin the header acceptance rules: the Authorization value must split
+on whitespace into exactly a case-insensitive 'Bearer' scheme and a token.
+"""
+
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+
+from impresso_content_auth.strategy.extractor.bearer_token import (
+    BearerTokenExtractor,
+)
+
+
+def make_request(authorization: Optional[str] = None) -> Request:
+    """Build a minimal request, optionally with an Authorization header."""
+    headers = (
+        Headers({"authorization": authorization})
+        if authorization is not None
+        else Headers()
+    )
+    return Request({"type": "http", "headers": headers.raw})
+
+
+async def test_extracts_bearer_token() -> None:
+    """A well-formed bearer header yields the token."""
+    extractor = BearerTokenExtractor()
+    assert await extractor(make_request("Bearer abc123")) == "abc123"
+
+
+async def test_scheme_is_case_insensitive() -> None:
+    """The Bearer scheme matches regardless of case."""
+    extractor = BearerTokenExtractor()
+    assert await extractor(make_request("bearer abc123")) == "abc123"
+    assert await extractor(make_request("BEARER abc123")) == "abc123"
+
+
+async def test_accepts_tab_separated_scheme_and_token() -> None:
+    """Any ASCII whitespace may separate scheme and token."""
+    extractor = BearerTokenExtractor()
+    assert await extractor(make_request("Bearer\tabc123")) == "abc123"
+
+
+async def test_rejects_token_with_embedded_whitespace() -> None:
+    """More than two whitespace-separated parts is not a valid header."""
+    extractor = BearerTokenExtractor()
+    assert await extractor(make_request("Bearer a b")) is None
+
+
+async def test_rejects_scheme_without_token() -> None:
+    """A bare scheme with no token yields None."""
+    extractor = BearerTokenExtractor()
+    assert await extractor(make_request("Bearer")) is None
+
+
+async def test_rejects_other_schemes() -> None:
+    """Non-bearer authorization schemes yield None."""
+    extractor = BearerTokenExtractor()
+    assert await extractor(make_request("Basic abc123")) is None
+
+
+async def test_missing_header_returns_none() -> None:
+    """A request without an Authorization header yields None."""
+    extractor = BearerTokenExtractor()
+    assert await extractor(make_request()) is None
@@ -0,0 +1,165 @@
+"""
+Tests for the Solr document extractor.
+
+Cover the Lucene escaping of header-derived document IDs, the routing of
+wildcard/comma IDs around the terms-query micro-batcher, and the batcher
+itself (coalescing, misses, failure fan-out).
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, cast
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+
+from impresso_content_auth.service.solr import SolrService
+from impresso_content_auth.strategy.extractor.solr_document import (
+    SolrDocumentExtractor,
+    _escape_solr_term,
+)
+
+
+class FakeSolrService:
+    """Records search calls and returns a canned document list."""
+
+    def __init__(self, docs: List[Dict[str, Any]]):
+        self.docs = docs
+        self.calls: List[Dict[str, Any]] = []
+
+    async def search(
+        self,
+        collection: str,
+        q: str,
+        fields: Optional[List[str]] = None,
+        rows: int = 10,
+    ) -> Dict[str, Any]:
+        self.calls.append(
+            {"collection": collection, "q": q, "fields": fields, "rows": rows}
+        )
+        return {"response": {"docs": self.docs}}
+
+
+def make_request(doc_id: Optional[str]) -> Request:
+    """Build a minimal request carrying the doc ID in its scope."""
+    return Request({"type": "http", "headers": Headers().raw, "doc_id": doc_id})
+
+
+def doc_id_from_scope(request: Request) -> Optional[str]:
+    """ID extractor reading the doc ID planted by make_request."""
+    return cast(Optional[str], request.scope["doc_id"])
+
+
+def make_extractor(service: FakeSolrService) -> SolrDocumentExtractor[Any]:
+    """Wire an extractor over the fake Solr service."""
+    return SolrDocumentExtractor(
+        solr_service=cast(SolrService, service),
+        collection="documents",
+        id_extractor_func=doc_id_from_scope,
+        field="bitmap",
+    )
+
+
+def test_escape_solr_term_escapes_special_characters() -> None:
+    """Lucene query syntax characters are backslash-escaped."""
+    assert _escape_solr_term("a:b") == "a\\:b"
+    assert _escape_solr_term("a/b c") == "a\\/b\\ c"
+    assert _escape_solr_term('x"y') == 'x\\"y'
+    assert _escape_solr_term("a+b(c)") == "a\\+b\\(c\\)"
+
+
+def test_escape_solr_term_preserves_trailing_wildcard() -> None:
+    """Only a single trailing * survives unescaped; inner ones do not."""
+    assert _escape_solr_term("EXP-1829-a-*") == "EXP\\-1829\\-a\\-*"
+    assert _escape_solr_term("a*b") == "a\\*b"
+    assert _escape_solr_term("a*b*") == "a\\*b*"
+
+
+async def test_wildcard_id_bypasses_batcher() -> None:
+    """Wildcard IDs go through a single escaped query, not the terms batch."""
+    service = FakeSolrService([{"bitmap": "101"}])
+    extractor = make_extractor(service)
+
+    result = await extractor(make_request("EXP-1829-a-*"))
+
+    assert result is not None
+    assert int(result) == 0b101
+    assert len(service.calls) == 1
+    assert service.calls[0]["q"] == "id:EXP\\-1829\\-a\\-*"
+    assert service.calls[0]["rows"] == 1
+
+
+async def test_comma_id_bypasses_batcher() -> None:
+    """IDs containing commas would corrupt a terms join and go individually."""
+    service = FakeSolrService([{"bitmap": "110"}])
+    extractor = make_extractor(service)
+
+    result = await extractor(make_request("a,b"))
+
+    assert result is not None
+    assert int(result) == 0b110
+    assert len(service.calls) == 1
+    assert service.calls[0]["q"] == "id:a,b"
+    assert service.calls[0]["rows"] == 1
+
+
+async def test_concurrent_ids_coalesce_into_one_terms_query() -> None:
+    """Exact IDs looked up within the batch window share one Solr query."""
+    service = FakeSolrService(
+        [
+            {"id": "doc-a", "bitmap": "100"},
+            {"id": "doc-b", "bitmap": "010"},
+        ]
+    )
+    extractor = make_extractor(service)
+
+    result_a, result_b = await asyncio.gather(
+        extractor(make_request("doc-a")),
+        extractor(make_request("doc-b")),
+    )
+
+    assert result_a is not None and int(result_a) == 0b100
+    assert result_b is not None and int(result_b) == 0b010
+    assert len(service.calls) == 1
+    query = service.calls[0]["q"]
+    assert query.startswith("{!terms f=id}")
+    assert set(query.removeprefix("{!terms f=id}").split(",")) == {"doc-a", "doc-b"}
+    assert service.calls[0]["rows"] == 2
+
+
+async def test_missing_id_resolves_to_none() -> None:
+    """An ID absent from the batch response resolves to None, not a hang."""
+    service = FakeSolrService([{"id": "doc-a", "bitmap": "100"}])
+    extractor = make_extractor(service)
+
+    result_a, result_missing = await asyncio.gather(
+        extractor(make_request("doc-a")),
+        extractor(make_request("doc-gone")),
+    )
+
+    assert result_a is not None and int(result_a) == 0b100
+    assert result_missing is None
+    assert len(service.calls) == 1
+
+
+async def test_batch_failure_propagates_to_every_waiter() -> None:
+    """A failed batch query resolves all waiters with the exception."""
+
+    class FailingSolrService:
+        async def search(self, **kwargs: Any) -> Dict[str, Any]:
+            raise ConnectionError("solr down")
+
+    extractor = SolrDocumentExtractor(
+        solr_service=cast(SolrService, FailingSolrService()),
+        collection="documents",
+        id_extractor_func=doc_id_from_scope,
+        field="bitmap",
+    )
+
+    results = await asyncio.gather(
+        extractor(make_request("doc-a")),
+        extractor(make_request("doc-b")),
+        return_exceptions=True,
+    )
+
+    assert len(results) == 2
+    assert all(isinstance(result, ConnectionError) for result in results)